@@ -1,5 +1,6 @@
 """Interface for objects useful to processing hub entries"""
 
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 import json
 import os
@@ -51,16 +52,31 @@ class FusionConformanceResult:
 
 
 def checkout_repo_and_run_conformance(
-    github_organization: str, github_repo_name: str, package_name: str, limit: int = 0
+    github_organization: str,
+    github_repo_name: str,
+    package_name: str,
+    limit: int = 0,
+    cache_dir: Optional[Path] = None,
 ) -> dict[str, FusionConformanceResult]:
+    """Clone a package repo and run parse conformance for its tagged versions.
+
+    If cache_dir is set, the clone is kept in a subdirectory of it and reused
+    by later runs instead of cloning the repo again.
+    """
     results: dict[str, FusionConformanceResult] = {}
-    with TemporaryDirectory() as tmpdir:
-        print(f"writing to {tmpdir}")
+    # only clone into a temporary directory when there is no cache directory to keep the clone in
+    clone_dir = (
+        TemporaryDirectory()
+        if cache_dir is None
+        else nullcontext(str(cache_dir / f"{github_organization}__{github_repo_name}"))
+    )
+    with clone_dir as repo_path:
+        print(f"writing to {repo_path}")
         repo = DbtPackageRepo(
             repo_name=package_name,
             github_organization=github_organization,
             github_repo_name=github_repo_name,
-            local_path=tmpdir,
+            local_path=repo_path,
         )
         package_id = f"{github_organization}/{github_repo_name}"
         # package: DbtPackage = DbtPackage(package_name=package_name, package_id=package_id, project_config_raw_version_specifier=None)
@@ -71,7 +87,7 @@ def checkout_repo_and_run_conformance(
             checked_out = repo.checkout_tag(tag, stash_changes=True)
             console.log(f"tag {tag.name} checked out: {checked_out}")
             tag_version = tag.name[1:] if tag.name[0] == "v" else tag.name
-            result = run_conformance_for_version(tmpdir, package_name, tag_version, package_id)
+            result = run_conformance_for_version(repo_path, package_name, tag_version, package_id)
             if result:
                 results[tag_version] = result
     return results
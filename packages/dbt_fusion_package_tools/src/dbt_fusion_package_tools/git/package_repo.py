@@ -55,7 +55,8 @@ class DbtPackageRepo:
             raise GitOperationError("Git repo not created, check parameters")
 
     def _check_if_directory_contains_repo(self, path: Optional[PathLike]):
-        return path and is_git_dir(path)
+        # path can be either a bare repo or the working tree of a clone
+        return path and (is_git_dir(path) or is_git_dir(Path(path) / ".git"))
 
     def git_url(self, path: PathLike) -> str:
         if str(path)[-4:] == ".git":
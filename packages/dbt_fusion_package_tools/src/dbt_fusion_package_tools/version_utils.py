@@ -1,6 +1,7 @@
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Iterable, List, Optional, Union
 
 from mashumaro import DataClassDictMixin
@@ -61,6 +62,62 @@ $
 
 _VERSION_REGEX = re.compile(_VERSION_REGEX_PAT_STR, re.VERBOSE)
 
+# longer matchers first so ">=" isn't read as ">"
+_MATCHER_PREFIXES = (">=", "<=", ">", "<", "=")
+
+# major, minor and patch
+_SEMVER_PARTS = 3
+
+# major, minor, patch, prerelease, build, matcher
+_ParsedVersion = tuple[str, str, str, Optional[str], Optional[str], Matchers]
+
+
+def _parse_plain_version_string(version_string: str) -> Optional[_ParsedVersion]:
+    """Parse the common "[matcher]MAJOR.MINOR.PATCH" form without the regex.
+
+    Returns None for anything else (prerelease, build metadata, invalid versions)
+    so the caller can fall back to the full semver regex.
+    """
+    matcher = Matchers.EXACT
+    for prefix in _MATCHER_PREFIXES:
+        if version_string.startswith(prefix):
+            matcher = Matchers(prefix)
+            version_string = version_string[len(prefix) :]
+            break
+
+    parts = version_string.split(".")
+    if len(parts) != _SEMVER_PARTS:
+        return None
+    for part in parts:
+        if not (part.isascii() and part.isdigit()) or (part[0] == "0" and part != "0"):
+            return None
+    major, minor, patch = parts
+    return (major, minor, patch, None, None, matcher)
+
+
+# The same handful of version strings recur across packages.yml, package-lock.yml and the
+# compatibility output, so parse results are cached. VersionSpecifiers are mutable, so
+# callers always get a fresh instance built from the cached fields.
+@lru_cache(maxsize=4096)
+def _parse_version_string(version_string: str) -> _ParsedVersion:
+    parsed = _parse_plain_version_string(version_string)
+    if parsed is not None:
+        return parsed
+
+    match = _VERSION_REGEX.match(version_string)
+
+    if not match:
+        raise SemverError(f'"{version_string}" is not a valid semantic version.')
+
+    return (
+        match.group("major"),
+        match.group("minor"),
+        match.group("patch"),
+        match.group("prerelease"),
+        match.group("build"),
+        Matchers(match.group("matcher") or Matchers.EXACT),
+    )
+
 
 def _cmp(a: Any, b: Any) -> int:
     """Return negative if a<b, zero if a==b, positive if a>b."""
@@ -86,15 +143,8 @@ class VersionSpecifier(VersionSpecification):
 
     @classmethod
     def from_version_string(cls, version_string: str) -> "VersionSpecifier":
-        match = _VERSION_REGEX.match(version_string)
-
-        if not match:
-            raise SemverError(f'"{version_string}" is not a valid semantic version.')
-
-        matched = {k: str(v) for k, v in match.groupdict().items() if v is not None}
-        spec = cls.from_dict(matched)
-        assert isinstance(spec, VersionSpecifier)
-        return spec
+        major, minor, patch, prerelease, build, matcher = _parse_version_string(version_string)
+        return cls(major=major, minor=minor, patch=patch, prerelease=prerelease, build=build, matcher=matcher)
 
     def __str__(self) -> str:
         return self.to_version_string()
@@ -225,7 +275,7 @@ class VersionSpecifier(VersionSpecification):
         return _cmp(len(a), len(b))
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionRange:
     start: VersionSpecifier
     end: VersionSpecifier
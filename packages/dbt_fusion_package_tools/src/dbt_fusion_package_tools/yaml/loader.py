@@ -32,6 +32,20 @@ class SafeLoaderWithOutput(Reader, Scanner, Parser, Composer, SafeConstructorWit
         Resolver.__init__(self)
 
 
+try:
+    from yaml.cyaml import CParser
+
+    # Same as SafeLoaderWithOutput, but scans, parses and composes with LibYAML
+    class CSafeLoaderWithOutput(CParser, SafeConstructorWithOutput, Resolver):
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+except ImportError:
+    CSafeLoaderWithOutput = SafeLoaderWithOutput  # type: ignore[assignment,misc]
+
+
 def load(stream, Loader):
     """
     Parse the first YAML document in a stream
@@ -47,4 +61,4 @@ def load(stream, Loader):
 
 # Returns a tuple where the first entry is the raw mapping node and the second is the document
 def safe_load(stream):
-    return load(stream, SafeLoaderWithOutput)
+    return load(stream, CSafeLoaderWithOutput)
@@ -1,6 +1,7 @@
 import json
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 import re
 
@@ -10,6 +11,14 @@ from rich.console import Console
 console = Console()
 HTTP_ERROR_CODE = 400
 
+# Compiled once at import, job steps are rewritten one by one across all jobs.
+# -m, --model and --models are replaced in a single pass; the surrounding whitespace
+# is only looked at, not consumed, so flags sharing a space are all replaced
+MODELS_FLAG_PATTERN = re.compile(r"(?<=\s)(?:-m|--models?)(?=\s)")
+MODELS_FLAG_REPLACEMENTS = {"-m": "-s", "--model": "--select", "--models": "--select"}
+# -o/--output and its value, including the whitespace before the flag
+OUTPUT_FLAG_PATTERN = re.compile(r"\s(?:-o|--output)\s+\S+")
+
 
 def job_dict_to_payload(job_dict: dict) -> dict:
     """Convert a job dictionary to a payload dictionary."""
@@ -74,19 +83,24 @@ def job_steps_updated(job_dict: dict, behavior_change: bool) -> tuple[bool, List
     return steps_changed, updated_steps
 
 
+def _replace_models_flag(match: re.Match) -> str:
+    return MODELS_FLAG_REPLACEMENTS[match.group(0)]
+
+
+# Step rewrites are pure, and the same commands tend to repeat across an account's jobs
+@lru_cache(maxsize=1024)
 def step_regex_replace_m_with_s(step: str) -> str:
     """Replace -m with -s and --model/--models with --select."""
-    step = re.sub(r"(\s)-m(\s)", r"\1-s\2", step)
-    step = re.sub(r"(\s)--model[s]?(\s)", r"\1--select\2", step)
-    return step
+    return MODELS_FLAG_PATTERN.sub(_replace_models_flag, step)
 
 
+@lru_cache(maxsize=1024)
 def step_remove_source_freshness_output(step: str) -> str:
     """Remove --output in source freshness commands."""
-    if ("dbt source freshness") in step:
-        step = re.sub(r"(\s)-o(\s+)\S+", "", step)
-        step = re.sub(r"(\s)--output(\s+)\S+", "", step)
-    return step
+    # plain substring check first, so steps for other commands never reach the regex
+    if "dbt source freshness" not in step:
+        return step
+    return OUTPUT_FLAG_PATTERN.sub("", step)
 
 
 class DBTClient:
@@ -2,12 +2,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple
 
-import yaml
 import yamllint.config
 import yamllint.linter
 from rich.console import Console
 
-from dbt_autofix.refactors.yml import DbtYAML
+from dbt_autofix.refactors.yml import DbtYAML, safe_load
 
 console = Console()
 
@@ -43,9 +42,7 @@ def find_duplicate_keys(
     yml_files = set(root_dir.glob("**/*.yml")).union(set(root_dir.glob("**/*.yaml")))
     yml_files_target = set((root_dir / "target").glob("**/*.yml")).union(set((root_dir / "target").glob("**/*.yaml")))
 
-    packages_path = yaml.safe_load((root_dir / "dbt_project.yml").read_text()).get(
-        "packages-install-path", "dbt_packages"
-    )
+    packages_path = safe_load((root_dir / "dbt_project.yml").read_text()).get("packages-install-path", "dbt_packages")
 
     yml_files_packages = set((root_dir / packages_path).glob("**/*.yml")).union(
         set((root_dir / packages_path).glob("**/*.yaml"))
@@ -75,7 +72,7 @@ def find_duplicate_keys(
                     )
                 )
         if file_with_duplicate and not dry_run:
-            without_duplicates = yaml.safe_load(file_content)
+            without_duplicates = safe_load(file_content)
             ruamel_yaml = DbtYAML()
             ruamel_yaml.dump_to_string(without_duplicates)  # type: ignore
 
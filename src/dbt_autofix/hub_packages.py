@@ -1,9 +1,10 @@
 from pathlib import Path
 import urllib.request
 from typing import Optional, Set
-from yaml import safe_load
 import json
 
+from dbt_autofix.refactors.yml import safe_load
+
 
 def should_skip_package(package_path: Path, include_private_packages: bool) -> bool:
     """Determine if a package should be skipped based on hub status and flags.
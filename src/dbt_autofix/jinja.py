@@ -1,4 +1,6 @@
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import jinja2
@@ -7,6 +9,13 @@ from dbt_common.clients.jinja import get_environment
 from dbt_extractor import ExtractionError, py_extract_from_source  # type: ignore
 
 
+@lru_cache(maxsize=1)
+def _get_parse_environment() -> jinja2.Environment:
+    """Jinja environment used for static parsing, built once since parse() doesn't change it."""
+    # set 'capture_macros' to capture undefined
+    return get_environment(None, capture_macros=True)
+
+
 def statically_parse_unrendered_config(string: str) -> Optional[Dict[str, Any]]:
     """
     Given a string with jinja, extract an unrendered config call.
@@ -20,14 +29,19 @@ def statically_parse_unrendered_config(string: str) -> Optional[Dict[str, Any]]:
     "select 1 as id"
     returns: None
     """
-    # Return early to avoid creating jinja environemt if no config call in input string
+    # Return early to avoid parsing with jinja if no config call in input string
     if "config(" not in string:
         return None
 
-    # set 'capture_macros' to capture undefined
-    env = get_environment(None, capture_macros=True)
+    unrendered_config = _statically_parse_config_call(string)
+    # copy so callers can't modify the cached result, the values are all source strings
+    return dict(unrendered_config) if unrendered_config else None
+
 
-    parsed = env.parse(string)
+# the same config blocks tend to repeat across a project's models
+@lru_cache(maxsize=4096)
+def _statically_parse_config_call(string: str) -> Optional[Dict[str, Any]]:
+    parsed = _get_parse_environment().parse(string)
     func_calls = tuple(parsed.find_all(jinja2.nodes.Call))
 
     config_func_calls = list(
@@ -68,8 +82,6 @@ def _extract_dict_value_from_source(source_string: str, key: str) -> str:
     This is used for dictionary literal arguments like config({'key': value}).
     Handles both single and double quotes for keys.
     """
-    import re
-
     # Find the config( and the dictionary
     config_match = re.search(r"\{\{\s*config\s*\(\s*\{", source_string)
     if not config_match:
@@ -102,6 +114,17 @@ def _extract_dict_value_from_source(source_string: str, key: str) -> str:
     return repr(key)  # Fallback
 
 
+# Characters the extractor tracks nesting and string literals with
+_STRUCTURAL_CHARS = "()[]{}\"'"
+
+
+@lru_cache(maxsize=None)
+def _extractor_token_pattern(delimiters: tuple) -> re.Pattern:
+    """Pattern matching the structural characters plus the single-character delimiters."""
+    chars = set(_STRUCTURAL_CHARS).union(d for d in delimiters if len(d) == 1)
+    return re.compile("[" + "".join(re.escape(char) for char in sorted(chars)) + "]")
+
+
 class _SourceCodeExtractor:
     """Helper class to extract source code segments while handling nested structures.
 
@@ -138,8 +161,10 @@ class _SourceCodeExtractor:
         string_char = None
         end_pos = self.length
 
-        for i in range(start_pos, self.length):
-            char = self.source[i]
+        # only the structural characters and delimiters change the state, so jump straight between them
+        for token in _extractor_token_pattern(tuple(delimiters)).finditer(self.source, start_pos):
+            i = token.start()
+            char = token.group()
 
             # Handle string literals
             if char in ('"', "'") and (i == 0 or self.source[i - 1] != "\\"):
@@ -192,8 +217,6 @@ def construct_static_kwarg_value(kwarg, source_string: str) -> str:
         Input: kwarg with key='materialized', source="config(materialized=env_var('X'))"
         Output: "env_var('X')"
     """
-    import re
-
     try:
         key = kwarg.key
 
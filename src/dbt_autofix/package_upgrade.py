@@ -199,11 +199,12 @@ def check_for_package_upgrades(deps_file: DbtPackageFile) -> list[PackageVersion
     for package in deps_file.package_dependencies:
         if package not in packages_to_check:
             continue
-        public_package: bool = deps_file.package_dependencies[package].is_public_package()
-        installed_version: str = deps_file.package_dependencies[package].get_installed_package_version()
-        installed_version_compat: PackageVersionFusionCompatibilityState = deps_file.package_dependencies[
-            package
-        ].is_installed_version_fusion_compatible()
+        dbt_package = deps_file.package_dependencies[package]
+        public_package: bool = dbt_package.is_public_package()
+        installed_version: str = installed_package_versions[package]
+        installed_version_compat: PackageVersionFusionCompatibilityState = (
+            dbt_package.is_installed_version_fusion_compatible()
+        )
 
         # if version is compatible based on version range, include private packages
         if installed_version_compat == PackageVersionFusionCompatibilityState.DBT_VERSION_RANGE_INCLUDES_2_0:
@@ -319,13 +320,10 @@ def check_for_package_upgrades(deps_file: DbtPackageFile) -> list[PackageVersion
         if package not in packages_to_check or package not in some_versions_compatible:
             continue
         dbt_package = deps_file.package_dependencies[package]
-        installed_version: str = deps_file.package_dependencies[package].get_installed_package_version()
-        installed_version_compat: PackageVersionFusionCompatibilityState = deps_file.package_dependencies[
-            package
-        ].is_installed_version_fusion_compatible()
-        package_version_range: Optional[VersionRange] = deps_file.package_dependencies[
-            package
-        ].project_config_version_range
+        installed_version_compat: PackageVersionFusionCompatibilityState = (
+            dbt_package.is_installed_version_fusion_compatible()
+        )
+        package_version_range: Optional[VersionRange] = dbt_package.project_config_version_range
 
         installed_version_spec = dbt_package.installed_package_version
         # in case the user hadn't run dbt deps, estimate version
@@ -1,3 +1,4 @@
+import os
 from collections import defaultdict
 from typing import Any, Optional
 from dbt_fusion_package_tools.dbt_package import DbtPackage
@@ -9,8 +10,8 @@ from dbt_fusion_package_tools.upgrade_status import (
     PackageVersionFusionCompatibilityState,
     PackageFusionCompatibilityState,
 )
-from dbt_autofix.refactors.yml import read_file
 from dbt_fusion_package_tools.version_utils import Matchers
+from dbt_autofix.refactors.yml import safe_load
 
 console = Console()
 
@@ -32,13 +33,14 @@ def find_package_yml_files(
     Returns:
         list[Path]: the file path(s) for packages/dependencies.yml
     """
-    yml_files = set(root_dir.glob("*.yml")).union(set(root_dir.glob("*.yaml")))
-
     package_yml_files = []
 
-    for yml_file in yml_files:
-        if yml_file.name in VALID_PACKAGE_YML_NAMES:
-            package_yml_files.append(yml_file)
+    # package files only live at the project root, so a single scandir is enough
+    if root_dir.is_dir():
+        with os.scandir(root_dir) as entries:
+            for entry in entries:
+                if entry.name in VALID_PACKAGE_YML_NAMES and entry.is_file():
+                    package_yml_files.append(root_dir / entry.name)
 
     if len(package_yml_files) == 0:
         console.log("No package YML files found")
@@ -48,6 +50,9 @@ def find_package_yml_files(
 def load_yaml_from_packages_yml(packages_yml_path: Path) -> dict[Any, Any]:
     """Parse YAML from a packages.yml file.
 
+    The file is read with PyYAML's safe loader, so YAML 1.1 scalars apply
+    (e.g. `warn-unpinned: no` is False) and a repeated key keeps its last value.
+
     Args:
         packages_yml_path (Path): file path for packages.yml
 
@@ -76,11 +81,12 @@ def load_yaml_from_packages_yml(packages_yml_path: Path) -> dict[Any, Any]:
         return {}
 
     try:
-        parsed_package_file = read_file(packages_yml_path)
+        with open(packages_yml_path, "r") as packages_yml_file:
+            parsed_package_file = safe_load(packages_yml_file)
     except:
         console.log(f"Error when parsing package file {packages_yml_path}")
         return {}
-    if parsed_package_file == {}:
+    if not parsed_package_file:
         console.log("No content parsed")
         return {}
     else:
@@ -95,11 +101,12 @@ def load_yaml_from_dependencies_yml(dependencies_yml_path: Path) -> dict[Any, An
         return {}
 
     try:
-        parsed_package_file = read_file(dependencies_yml_path)
+        with open(dependencies_yml_path, "r") as dependencies_yml_file:
+            parsed_package_file = safe_load(dependencies_yml_file)
     except:
         console.log(f"Error when parsing package file {dependencies_yml_path}")
         return {}
-    if parsed_package_file == {}:
+    if not parsed_package_file:
         console.log("No content parsed")
         return {}
     else:
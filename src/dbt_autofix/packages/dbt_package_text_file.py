@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from pathlib import Path
 import re
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 from rich.console import Console
 
 from dbt_fusion_package_tools.fusion_version_compatibility_output import FUSION_VERSION_COMPATIBILITY_OUTPUT
@@ -9,20 +9,43 @@ from dbt_fusion_package_tools.fusion_version_compatibility_output import FUSION_
 console = Console()
 error_console = Console(stderr=True)
 
-VERSION_PREFIX = re.compile(r"^\s*(?:-\s*)?version:\s*")
-PACKAGE_PREFIX = re.compile(r"^\s*(?:-\s*)?package:\s*")
-KEY_PATTERN = re.compile(r"^\s*-")
-PACKAGE_PATTERN = re.compile(r"^\s*(?:-\s*)?package:")
-VERSION_PATTERN = re.compile(r"^\s*(?:-\s*)?version:")
-VERSION_MATCH_STRING = re.compile(r"\s*(?P<version>[^\s#\r\n]+)")
-VERSION_MATCH_LIST = re.compile(r"(?P<version>\[[^\]]*\])")
-PACKAGE_MATCH = re.compile(r"\s*(?P<pkg>[^\s#\r\n]+)")
+# Each pattern splits a line into the key prefix, the value (up to the first whitespace,
+# '#' or line ending) and whatever follows it, in a single match
+VERSION_LINE = re.compile(r"^(?P<prefix>\s*(?:-\s*)?version:\s*)(?P<version>\[[^\]]*\]|[^\s#\r\n\[][^\s#\r\n]*)")
+PACKAGE_LINE = re.compile(r"^(?P<prefix>\s*(?:-\s*)?package:\s*)(?P<pkg>[^\s#\r\n]+)")
 
 
-@dataclass
+@dataclass(slots=True)
 class DbtPackageTextFileLine:
     line: str
     modified: bool = False
+    # Cached result of _classify(), the key prefix is preserved when a line is modified
+    _kind: Optional[tuple[bool, Literal["package", "version", "none"]]] = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    # Cached results of extract_package_from_line/extract_version_from_line, reset when the line is replaced
+    _package_parts: Optional[list[str]] = field(init=False, default=None, repr=False, compare=False)
+    _version_parts: Optional[list[str]] = field(init=False, default=None, repr=False, compare=False)
+
+    def _classify(self) -> tuple[bool, Literal["package", "version", "none"]]:
+        """Classify the line by its leading characters.
+
+        Returns:
+            tuple[bool, str]: whether the line starts a new `-` block, and whether
+            its key is "package", "version" or "none"
+        """
+        if self._kind is None:
+            rest = self.line.lstrip()
+            starts_block = rest.startswith("-")
+            if starts_block:
+                rest = rest[1:].lstrip()
+            if rest.startswith("package:"):
+                self._kind = (starts_block, "package")
+            elif rest.startswith("version:"):
+                self._kind = (starts_block, "version")
+            else:
+                self._kind = (starts_block, "none")
+        return self._kind
 
     def extract_version_from_line(self) -> list[str]:
         """Extracts a version string while retaining the key and line ending.
@@ -41,25 +64,17 @@ class DbtPackageTextFileLine:
         Returns:
             list[str]: [beginning of line, version, end of line] or [] if no package name found
         """
+        if self._version_parts is None:
+            self._version_parts = self._extract_version_parts()
+        return self._version_parts
+
+    def _extract_version_parts(self) -> list[str]:
         if not self.line_contains_version():
             return []
-        m = VERSION_PREFIX.match(self.line)
+        m = VERSION_LINE.match(self.line)
         if not m:
             return []
-
-        rest = self.line[m.end() :]
-        if len(rest) == 0:
-            return []
-        if rest[0] == "[":  # version is a list
-            version_match = VERSION_MATCH_LIST.match(rest)
-        # Extract version up to first whitespace, '#' or line ending
-        else:
-            version_match = VERSION_MATCH_STRING.match(rest)
-        if not version_match:
-            return []
-        version = version_match.group("version")
-        eol = rest[version_match.end("version") :]
-        return [self.line[: m.end()], version, eol]
+        return [m.group("prefix"), m.group("version"), self.line[m.end("version") :]]
 
     def extract_package_from_line(self) -> list[str]:
         """Extracts a package string while retaining the key and line ending.
@@ -76,23 +91,18 @@ class DbtPackageTextFileLine:
         Returns:
             list[str]: the deconstructed line or [] if no package name found
         """
+        if self._package_parts is None:
+            self._package_parts = self._extract_package_parts()
+        return self._package_parts
+
+    def _extract_package_parts(self) -> list[str]:
         if not self.line_contains_package():
             return []
-        m = PACKAGE_PREFIX.match(self.line)
+        m = PACKAGE_LINE.match(self.line)
         if not m:
             return []
-
-        rest = self.line[m.end() :]
-        # Extract package id up to first whitespace, '#' or line ending
-        pkg_match = PACKAGE_MATCH.match(rest)
-        if not pkg_match:
-            return []
-        pkg = pkg_match.group("pkg")
-        if pkg is not None:
-            pkg = pkg.strip('"')
-            pkg = pkg.strip("'")
-        eol = rest[pkg_match.end("pkg") :]
-        return [self.line[: m.end()], pkg, eol]
+        pkg = m.group("pkg").strip('"').strip("'")
+        return [m.group("prefix"), pkg, self.line[m.end("pkg") :]]
 
     def extract_package_name_from_line(self) -> str:
         """Extract the package name from a line containing a `package:` key.
@@ -116,6 +126,7 @@ class DbtPackageTextFileLine:
             return False
         self.line = f"{extracted_version[0]}{new_string}{extracted_version[2]}"
         self.modified = True
+        self._package_parts = None
         return True
 
     def replace_version_string_in_line(self, new_string: str) -> bool:
@@ -126,16 +137,17 @@ class DbtPackageTextFileLine:
             return False
         self.line = f"{extracted_version[0]}{new_string}{extracted_version[2]}"
         self.modified = True
+        self._version_parts = None
         return True
 
     def line_contains_key(self) -> bool:
-        return bool(KEY_PATTERN.match(self.line))
+        return self._classify()[0]
 
     def line_contains_package(self) -> bool:
-        return bool(PACKAGE_PATTERN.match(self.line))
+        return self._classify()[1] == "package"
 
     def line_contains_version(self) -> bool:
-        return bool(VERSION_PATTERN.match(self.line))
+        return self._classify()[1] == "version"
 
 
 @dataclass
@@ -189,7 +201,7 @@ class DbtPackageTextFile:
                         self.lines_with_version.append(current_line)
                         key_block.version_line = current_line
                     self.blocks_by_line.append(len(self.key_blocks))
-                    self.lines.append(DbtPackageTextFileLine(line))
+                    self.lines.append(new_line)
                 if key_block.end_line == -1:
                     key_block.end_line = current_line - 1
                     self.key_blocks.append(key_block)
@@ -236,10 +248,11 @@ class DbtPackageTextFile:
     def write_output_to_file(self) -> int:
         lines_written: int = 0
         try:
+            # lines keep their original endings, so the file is rebuilt and written in one call
+            file_content = "".join(file_line.line for file_line in self.lines)
             with open(self.file_path, "w") as file:
-                for file_line in self.lines:
-                    file.write(file_line.line)
-                    lines_written += 1
+                file.write(file_content)
+            lines_written = len(self.lines)
         except Exception as e:
             error_console.print(f"An error occurred: {e}")
         return lines_written
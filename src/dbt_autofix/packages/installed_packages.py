@@ -2,10 +2,9 @@ import os
 from pathlib import Path
 from typing import Any, Optional, Union
 from rich.console import Console
-import yaml
 
 from dbt_fusion_package_tools.dbt_package_version import DbtPackageVersion
-from dbt_autofix.refactors.yml import read_file
+from dbt_autofix.refactors.yml import safe_load
 
 console = Console()
 
@@ -52,9 +51,7 @@ def find_package_paths(
     Returns:
         list[Path]: the file path(s) for all dbt_project.yml files for packages
     """
-    packages_path = yaml.safe_load((root_dir / "dbt_project.yml").read_text()).get(
-        "packages-install-path", "dbt_packages"
-    )
+    packages_path = safe_load((root_dir / "dbt_project.yml").read_text()).get("packages-install-path", "dbt_packages")
 
     # check package path from project or default package path first
     installed_packages = find_packages_within_directory((root_dir / packages_path))
@@ -88,11 +85,12 @@ def load_yaml_from_package_dbt_project_yml_path(package_project_yml_path: Path)
         console.log("File must be dbt_project.yml")
         return {}
     try:
-        parsed_package_file = read_file(package_project_yml_path)
+        with open(package_project_yml_path, "r") as package_project_yml_file:
+            parsed_package_file = safe_load(package_project_yml_file)
     except:
         console.log(f"Error when parsing package file {package_project_yml_path}")
         return {}
-    if parsed_package_file == {}:
+    if not parsed_package_file:
         console.log("No content parsed")
         return {}
     else:
@@ -3,7 +3,6 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import yamllint.linter
 from rich.console import Console
-from yaml import safe_load
 
 from dbt_autofix.hub_packages import should_skip_package
 from dbt_autofix.refactors.changesets.dbt_project_yml import (
@@ -45,7 +44,7 @@ from dbt_autofix.refactors.results import (
     YMLRefactorResult,
     YMLRuleRefactorResult,
 )
-from dbt_autofix.refactors.yml import DbtYAML, yaml_config
+from dbt_autofix.refactors.yml import DbtYAML, safe_load, yaml_config
 from dbt_autofix.retrieve_schemas import (
     SchemaSpecs,
 )
@@ -353,10 +352,8 @@ def changeset_remove_duplicate_keys(yml_str: str) -> YMLRuleRefactorResult:
             )
 
     if refactored:
-        import yaml
-
         # we use dump from ruamel to keep indentation style but this loses quite a bit of formatting though
-        refactored_yaml = DbtYAML().dump_to_string(yaml.safe_load(yml_str))  # type: ignore
+        refactored_yaml = DbtYAML().dump_to_string(safe_load(yml_str))  # type: ignore
     else:
         refactored_yaml = yml_str
 
@@ -15,6 +15,9 @@ rules:
 
 yaml_config = yamllint.config.YamlLintConfig(config)
 
+# Pattern to match keys with space after plus: "+ key:" at the start of the line (after indentation)
+SPACE_AFTER_PLUS_PATTERN = re.compile(r"^(\s*)\+\s+(\w+)(\s*:)", re.MULTILINE)
+
 
 def changeset_dbt_project_remove_deprecated_config(
     yml_str: str, exclude_dbt_project_keys: bool = False
@@ -40,7 +43,8 @@ def changeset_dbt_project_remove_deprecated_config(
         "source-paths": "ConfigSourcePathDeprecation",
     }
 
-    yml_dict = DbtYAML().load(yml_str) or {}
+    yaml = DbtYAML()
+    yml_dict = yaml.load(yml_str) or {}
 
     for deprecated_field, _ in dict_deprecated_fields_with_defaults.items():
         if deprecated_field in yml_dict:
@@ -90,7 +94,7 @@ def changeset_dbt_project_remove_deprecated_config(
     return YMLRuleRefactorResult(
         rule_name="remove_deprecated_config",
         refactored=refactored,
-        refactored_yaml=DbtYAML().dump_to_string(yml_dict) if refactored else yml_str,  # type: ignore
+        refactored_yaml=yaml.dump_to_string(yml_dict) if refactored else yml_str,  # type: ignore
         original_yaml=yml_str,
         deprecation_refactors=deprecation_refactors,
     )
@@ -236,7 +240,8 @@ def changeset_dbt_project_prefix_plus_for_config(
     """Update keys for the config in dbt_project.yml under to prefix it with a `+`"""
     all_refactor_logs: List[str] = []
 
-    yml_dict = DbtYAML().load(yml_str) or {}
+    yaml = DbtYAML()
+    yml_dict = yaml.load(yml_str) or {}
 
     for node_type, node_fields in schema_specs.dbtproject_specs_per_node_type.items():
         for k, v in (yml_dict.get(node_type) or {}).copy().items():
@@ -283,14 +288,15 @@ def changeset_dbt_project_prefix_plus_for_config(
     return YMLRuleRefactorResult(
         rule_name="prefix_plus_for_config",
         refactored=refactored,
-        refactored_yaml=DbtYAML().dump_to_string(yml_dict) if refactored else yml_str,  # type: ignore
+        refactored_yaml=yaml.dump_to_string(yml_dict) if refactored else yml_str,  # type: ignore
         original_yaml=yml_str,
         deprecation_refactors=deprecation_refactors,
     )
 
 
 def changeset_dbt_project_flip_behavior_flags(yml_str: str) -> YMLRuleRefactorResult:
-    yml_dict = DbtYAML().load(yml_str) or {}
+    yaml = DbtYAML()
+    yml_dict = yaml.load(yml_str) or {}
     deprecation_refactors: List[DbtDeprecationRefactor] = []
     refactored = False
 
@@ -314,14 +320,15 @@ def changeset_dbt_project_flip_behavior_flags(yml_str: str) -> YMLRuleRefactorRe
     return YMLRuleRefactorResult(
         rule_name="flip_behavior_flags",
         refactored=refactored,
-        refactored_yaml=DbtYAML().dump_to_string(yml_dict) if refactored else yml_str,  # type: ignore
+        refactored_yaml=yaml.dump_to_string(yml_dict) if refactored else yml_str,  # type: ignore
         original_yaml=yml_str,
         deprecation_refactors=deprecation_refactors,
     )
 
 
 def changeset_dbt_project_flip_test_arguments_behavior_flag(yml_str: str) -> YMLRuleRefactorResult:
-    yml_dict = DbtYAML().load(yml_str) or {}
+    yaml = DbtYAML()
+    yml_dict = yaml.load(yml_str) or {}
     deprecation_refactors: List[DbtDeprecationRefactor] = []
     refactored = False
 
@@ -343,12 +350,38 @@ def changeset_dbt_project_flip_test_arguments_behavior_flag(yml_str: str) -> YML
     return YMLRuleRefactorResult(
         rule_name="changeset_dbt_project_flip_test_arguments_behavior_flag",
         refactored=refactored,
-        refactored_yaml=DbtYAML().dump_to_string(yml_dict) if refactored else yml_str,  # type: ignore
+        refactored_yaml=yaml.dump_to_string(yml_dict) if refactored else yml_str,  # type: ignore
         original_yaml=yml_str,
         deprecation_refactors=deprecation_refactors,
     )
 
 
+def _find_yml_entry_end(yml_str: str, start_line_pos: int, key_indent: int) -> int:
+    """Find where the entry whose key line starts at start_line_pos ends, including its nested value.
+
+    Following lines belong to the entry while they are blank or indented more than the key.
+    Lines are walked one at a time so only the entry itself is scanned, not the rest of the file.
+
+    Returns:
+        int: position right after the entry, including its trailing newline if there is one
+    """
+    line_end = yml_str.find("\n", start_line_pos)
+    end_pos = len(yml_str) if line_end == -1 else line_end
+    while end_pos < len(yml_str):
+        next_line_start = end_pos + 1
+        next_line_end = yml_str.find("\n", next_line_start)
+        if next_line_end == -1:
+            next_line_end = len(yml_str)
+        line = yml_str[next_line_start:next_line_end]
+        # Blank lines and lines indented more than the key are part of the value
+        if line.strip() != "" and len(line) - len(line.lstrip()) <= key_indent:
+            break
+        end_pos = next_line_end
+    if end_pos < len(yml_str) and yml_str[end_pos] == "\n":
+        end_pos += 1  # Include the trailing newline
+    return end_pos
+
+
 def changeset_fix_space_after_plus(yml_str: str, schema_specs: SchemaSpecs) -> YMLRuleRefactorResult:
     """Fix keys that have a space after the '+' prefix (e.g., '+ tags' -> '+tags').
 
@@ -368,11 +401,8 @@ def changeset_fix_space_after_plus(yml_str: str, schema_specs: SchemaSpecs) -> Y
     refactored = False
     deprecation_refactors: List[DbtDeprecationRefactor] = []
 
-    # Pattern to match keys with space after plus: "+ key:" at the start of the line (after indentation)
-    pattern = re.compile(r"^(\s*)\+\s+(\w+)(\s*:)", re.MULTILINE)
-
-    # First, let's identify all the matches
-    matches = list(pattern.finditer(yml_str))
+    # First, let's identify all the matches (most files have no '+' keys at all, skip the regex for those)
+    matches = list(SPACE_AFTER_PLUS_PATTERN.finditer(yml_str)) if "+" in yml_str else []
 
     if not matches:
         return YMLRuleRefactorResult(
@@ -388,93 +418,56 @@ def changeset_fix_space_after_plus(yml_str: str, schema_specs: SchemaSpecs) -> Y
     for node_type, node_fields in schema_specs.dbtproject_specs_per_node_type.items():
         all_valid_config_keys.update(node_fields.allowed_config_fields_dbt_project_with_plus)
 
-    # Separate matches into valid (fix) and invalid (remove) keys
-    # Process in reverse order to maintain correct offsets when removing/replacing
-    matches_with_action = []
+    # Build the refactored string in a single forward pass: unchanged text between matches
+    # is copied as is, valid keys are fixed and invalid entries are skipped
+    refactored_parts: List[str] = []
+    copied_up_to = 0
+    # Matches come in document order, so line numbers are counted from the previous match
+    line_num = 1
+    line_counted_up_to = 0
+
     for match in matches:
         key_name = match.group(2)
         corrected_key = f"+{key_name}"
-        line_num = yml_str[: match.start()].count("\n") + 1
+        line_num += yml_str.count("\n", line_counted_up_to, match.start())
+        line_counted_up_to = match.start()
+        refactored = True
 
         if corrected_key in all_valid_config_keys:
             # Valid key - fix by removing space
-            matches_with_action.append(("fix", match, corrected_key, key_name, line_num))
-        else:
-            # Invalid key - remove entire entry
-            matches_with_action.append(("remove", match, corrected_key, key_name, line_num))
-
-    # Sort by position in reverse to process from end to start (to maintain positions)
-    matches_with_action.sort(key=lambda x: x[1].start(), reverse=True)
-
-    # Build the refactored string
-    refactored_yaml = yml_str
-
-    for action, match, corrected_key, key_name, line_num in matches_with_action:
-        if action == "fix":
-            # Fix by removing space
-            indent = match.group(1)
-            colon_and_space = match.group(3)
-            original_full_match = match.group(0)
-            corrected_full = f"{indent}{corrected_key}{colon_and_space}"
-
-            start_pos = match.start()
-            end_pos = match.end()
-
-            refactored_yaml = refactored_yaml[:start_pos] + corrected_full + refactored_yaml[end_pos:]
-
-            refactored = True
-            deprecation_refactors.insert(
-                0,
+            deprecation_refactors.append(
                 DbtDeprecationRefactor(
                     log=f"Removed space after '+' in key '+ {key_name}' on line {line_num}, changed to '{corrected_key}'"
-                ),
+                )
             )
-        else:  # action == 'remove'
-            # Remove the entire key-value entry
-            # We need to find the entire block to remove, including nested content
-            start_line_pos = refactored_yaml.rfind("\n", 0, match.start()) + 1
+            # Keys nested under an entry that was already removed go away with it
+            if match.end() <= copied_up_to:
+                continue
             indent = match.group(1)
-
-            # Find the end of this entry by looking for the next line with same or less indentation
-            # or the next key at same level
-            lines = refactored_yaml[start_line_pos:].split("\n")
-            lines_to_remove = 1  # Start with the key line itself
-
-            # Check subsequent lines
-            for i in range(1, len(lines)):
-                line = lines[i]
-                if line.strip() == "":
-                    # Empty line - include it
-                    lines_to_remove += 1
-                    continue
-
-                # Calculate indentation
-                line_indent = len(line) - len(line.lstrip())
-                key_indent = len(indent)
-
-                # If this line has more indentation, it's part of the value
-                if line_indent > key_indent:
-                    lines_to_remove += 1
-                else:
-                    # Same or less indentation - this is the next entry
-                    break
-
-            # Calculate the end position
-            lines_text = "\n".join(lines[:lines_to_remove])
-            end_pos = start_line_pos + len(lines_text)
-            if end_pos < len(refactored_yaml) and refactored_yaml[end_pos] == "\n":
-                end_pos += 1  # Include the trailing newline
-
-            # Remove the block
-            refactored_yaml = refactored_yaml[:start_line_pos] + refactored_yaml[end_pos:]
-
-            refactored = True
-            deprecation_refactors.insert(
-                0,
+            colon_and_space = match.group(3)
+            corrected_full = f"{indent}{corrected_key}{colon_and_space}"
+            # The indentation can start on blank lines that were removed with the previous entry
+            overlap = max(copied_up_to - match.start(), 0)
+            refactored_parts.append(yml_str[copied_up_to : match.start() + overlap])
+            refactored_parts.append(corrected_full[overlap:])
+            copied_up_to = match.end()
+        else:
+            # Invalid key - remove the entire key-value entry, including nested content
+            deprecation_refactors.append(
                 DbtDeprecationRefactor(
                     log=f"Removed invalid key '+ {key_name}' on line {line_num} (not a valid config key)"
-                ),
+                )
             )
+            # Already inside a removed entry (nested, or only the blank lines before it)
+            if match.start() < copied_up_to:
+                continue
+            start_line_pos = yml_str.rfind("\n", 0, match.start()) + 1
+            indent = match.group(1)
+            refactored_parts.append(yml_str[copied_up_to:start_line_pos])
+            copied_up_to = _find_yml_entry_end(yml_str, start_line_pos, len(indent))
+
+    refactored_parts.append(yml_str[copied_up_to:])
+    refactored_yaml = "".join(refactored_parts)
 
     return YMLRuleRefactorResult(
         rule_name="fix_space_after_plus",
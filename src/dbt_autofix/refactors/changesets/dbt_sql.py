@@ -11,6 +11,15 @@ from dbt_autofix.retrieve_schemas import SchemaSpecs
 
 CONFIG_MACRO_PATTERN = re.compile(r"(\{\{\s*config\s*\()(.*?)(\)\s*\}\})", re.DOTALL)
 
+# Regex patterns for Jinja tag and comment matching in remove_unmatched_endings
+JINJA_TAG_PATTERN = re.compile(r"{%-?\s*((?s:.*?))\s*-?%}", re.DOTALL)
+# Match proper comments {# ... #}
+JINJA_COMMENT_PATTERN = re.compile(r"{#.*?#}", re.DOTALL)
+JINJA_MACRO_START_PATTERN = re.compile(r"^macro\s+([^\s(]+)")  # Captures macro name
+JINJA_IF_START_PATTERN = re.compile(r"^if[(\s]+.*")  # if blocks can also be {% if(...) %}
+JINJA_MACRO_END_PATTERN = re.compile(r"^endmacro")
+JINJA_IF_END_PATTERN = re.compile(r"^endif")
+
 
 def extract_config_macro(sql_content: str) -> Optional[str]:
     """
@@ -76,7 +85,7 @@ def extract_config_macro(sql_content: str) -> Optional[str]:
     return None
 
 
-def remove_unmatched_endings(sql_content: str) -> SQLRuleRefactorResult:  # noqa: PLR0912
+def remove_unmatched_endings(sql_content: str) -> SQLRuleRefactorResult:
     """Remove unmatched {% endmacro %} and {% endif %} tags from SQL content.
 
     Handles:
@@ -91,15 +100,6 @@ def remove_unmatched_endings(sql_content: str) -> SQLRuleRefactorResult:  # noqa
 
     Returns: SQLRuleRefactorResult
     """
-    # Regex patterns for Jinja tag and comment matching
-    JINJA_TAG_PATTERN = re.compile(r"{%-?\s*((?s:.*?))\s*-?%}", re.DOTALL)
-    # Match proper comments {# ... #}
-    JINJA_COMMENT_PATTERN = re.compile(r"{#.*?#}", re.DOTALL)
-    MACRO_START = re.compile(r"^macro\s+([^\s(]+)")  # Captures macro name
-    IF_START = re.compile(r"^if[(\s]+.*")  # if blocks can also be {% if(...) %}
-    MACRO_END = re.compile(r"^endmacro")
-    IF_END = re.compile(r"^endif")
-
     # First, identify all comment regions to skip them
     comment_regions: List[Tuple[int, int]] = []
     for comment_match in JINJA_COMMENT_PATTERN.finditer(sql_content):
@@ -165,28 +165,22 @@ def remove_unmatched_endings(sql_content: str) -> SQLRuleRefactorResult:  # noqa
             continue
 
         # Check for macro start
-        macro_match = MACRO_START.match(tag_content)
+        macro_match = JINJA_MACRO_START_PATTERN.match(tag_content)
         if macro_match:
             macro_name = macro_match.group(1)
             macro_stack.append((start_pos, end_pos, macro_name))
             continue
 
         # Check for if start
-        if IF_START.match(tag_content):
+        if JINJA_IF_START_PATTERN.match(tag_content):
             if_stack.append((start_pos, end_pos))
             continue
 
         # Handle endmacro
-        if MACRO_END.match(tag_content):
+        if JINJA_MACRO_END_PATTERN.match(tag_content):
             if not macro_stack:
                 to_remove.append((start_pos, end_pos))
-                # Count lines, adjusting for content before first newline
-                prefix = sql_content[:start_pos]
-                first_newline = prefix.find("\n")
-                if first_newline == -1:
-                    line_num = 1
-                else:
-                    line_num = prefix.count("\n", first_newline) + 1
+                line_num = sql_content.count("\n", 0, start_pos) + 1
                 deprecation_refactors.append(
                     DbtDeprecationRefactor(
                         log=f"Removed unmatched {{% endmacro %}} near line {line_num}",
@@ -198,16 +192,10 @@ def remove_unmatched_endings(sql_content: str) -> SQLRuleRefactorResult:  # noqa
             continue
 
         # Handle endif
-        if IF_END.match(tag_content):
+        if JINJA_IF_END_PATTERN.match(tag_content):
             if not if_stack:
                 to_remove.append((start_pos, end_pos))
-                # Count lines, adjusting for content before first newline
-                prefix = sql_content[:start_pos]
-                first_newline = prefix.find("\n")
-                if first_newline == -1:
-                    line_num = 1
-                else:
-                    line_num = prefix.count("\n", first_newline) + 1
+                line_num = sql_content.count("\n", 0, start_pos) + 1
                 deprecation_refactors.append(
                     DbtDeprecationRefactor(
                         log=f"Removed unmatched {{% endif %}} near line {line_num}",
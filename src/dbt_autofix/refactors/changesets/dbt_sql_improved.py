@@ -6,9 +6,9 @@ from dbt_autofix.refactors.results import DbtDeprecationRefactor, SQLRuleRefacto
 from dbt_autofix.retrieve_schemas import SchemaSpecs
 
 # Statically compiled regex patterns for performance
-# Pattern to detect config variable shadowing
-SET_CONFIG_PATTERN = re.compile(r"{%\s*set\s+config\s*=")
-CONFIG_ALIAS_PATTERN = re.compile(r"{%\s*set\s+\w+\s*=\s*config\s*%}")
+# Pattern to detect config variable shadowing ({% set config = ... %})
+# or aliasing ({% set cfg = config %}) in a single scan
+SHADOWED_CONFIG_PATTERN = re.compile(r"{%\s*set\s+(?:config\s*=|\w+\s*=\s*config\s*%})")
 
 # Pattern to match config.get() and config.require() calls
 # This handles:
@@ -25,10 +25,8 @@ CONFIG_ACCESS_PATTERN = re.compile(
     re.DOTALL,
 )
 
-# Pattern to detect chained config access
-CHAINED_ACCESS_PATTERN = re.compile(
-    r"config\.(get|require)\s*\([^)]+\)\s*\."  # config.get(...).
-)
+# Pattern matched right after a config access to detect chained access (config.get(...).)
+CHAINED_ACCESS_SUFFIX_PATTERN = re.compile(r"\s*\.")
 
 
 def move_custom_config_access_to_meta_sql_improved(
@@ -55,7 +53,7 @@ def move_custom_config_access_to_meta_sql_improved(
     refactor_warnings: List[str] = []
 
     # Check for variable shadowing more carefully
-    if SET_CONFIG_PATTERN.search(sql_content) or CONFIG_ALIAS_PATTERN.search(sql_content):
+    if SHADOWED_CONFIG_PATTERN.search(sql_content):
         refactor_warnings.append(
             "Detected potential config variable shadowing. Skipping refactor to avoid false positives."
         )
@@ -68,16 +66,26 @@ def move_custom_config_access_to_meta_sql_improved(
             refactor_warnings=refactor_warnings,
         )
 
+    # Neither config.get() nor config.require() can match, skip gathering the allowed fields
+    if "config." not in sql_content:
+        return SQLRuleRefactorResult(
+            rule_name="move_custom_config_access_to_meta_sql_improved",
+            refactored=False,
+            refactored_content=sql_content,
+            original_content=sql_content,
+            deprecation_refactors=[],
+            refactor_warnings=refactor_warnings,
+        )
+
     # Get all allowed config fields across all node types
     allowed_config_fields: Set[str] = set()
     for specs in schema_specs.yaml_specs_per_node_type.values():
         allowed_config_fields.update(specs.allowed_config_fields)
 
-    # Collect all replacements first
-    matches = list(CONFIG_ACCESS_PATTERN.finditer(refactored_content))
+    # Collect all replacements first, flagging chained access in the same pass
     replacements: List[Tuple[int, int, str, str]] = []
 
-    for match in matches:
+    for match in CONFIG_ACCESS_PATTERN.finditer(sql_content):
         method = match.group(1)  # 'get' or 'require'
         pre_whitespace = match.group("pre_ws")  # Whitespace before key
         quote_style = match.group("quote")  # Preserve original quote style
@@ -101,6 +109,14 @@ def move_custom_config_access_to_meta_sql_improved(
         replacements.append((start, end, replacement, original))
         refactored = True
 
+        # Chained access (config.get(...).items()) needs manual intervention
+        chained_match = CHAINED_ACCESS_SUFFIX_PATTERN.match(sql_content, end)
+        if chained_match:
+            refactor_warnings.append(
+                f"Detected chained config access: {sql_content[start : chained_match.end()][:50]}... "
+                "These patterns require manual review as the structure may need to be adjusted."
+            )
+
     # Apply replacements in reverse order to maintain correct positions
     for start, end, replacement, original in reversed(replacements):
         refactored_content = refactored_content[:start] + replacement + refactored_content[end:]
@@ -117,17 +133,6 @@ def move_custom_config_access_to_meta_sql_improved(
             )
         )
 
-    # Also check for chained access patterns that need manual intervention
-    chained_matches = list(CHAINED_ACCESS_PATTERN.finditer(sql_content))
-    for match in chained_matches:
-        # Extract the config key to check if it's custom
-        key_match = re.search(r"([\"'])([^\"']+)\1", match.group(0))
-        if key_match and key_match.group(2) not in allowed_config_fields:
-            refactor_warnings.append(
-                f"Detected chained config access: {match.group(0)[:50]}... "
-                "These patterns require manual review as the structure may need to be adjusted."
-            )
-
     return SQLRuleRefactorResult(
         rule_name="move_custom_config_access_to_meta_sql_improved",
         refactored=refactored,
@@ -2,6 +2,7 @@ import io
 from pathlib import Path
 from typing import Any, Dict
 
+import yaml
 from ruamel.yaml import YAML
 from ruamel.yaml.compat import StringIO
 import yamllint.config
@@ -13,6 +14,17 @@ rules:
 
 yaml_config = yamllint.config.YamlLintConfig(config)
 
+# Files that are only read are parsed with PyYAML, using libyaml's C loader when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: Any) -> Any:
+    """Parse YAML from a string or an open file with PyYAML's safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
+
 
 class DbtYAML(YAML):
     """dbt-compatible YAML class."""
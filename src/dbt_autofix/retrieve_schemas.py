@@ -1,7 +1,9 @@
 import json
 import logging
 import os
+import tempfile
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Optional
 
 import httpx
@@ -29,6 +31,8 @@ class DbtProjectSpecs:
 class SchemaSpecs:
     def __init__(self, version: Optional[str] = None, disable_ssl_verification: bool = False):
         self.disable_ssl_verification = disable_ssl_verification
+        # dbt_project.yml schema downloaded by _get_specs, kept for the dict config analysis
+        self._dbt_project_schema: dict[str, Any] = {}
         self.yaml_specs_per_node_type, self.dbtproject_specs_per_node_type, self.valid_top_level_yaml_fields = (
             self._get_specs(version)
         )
@@ -36,7 +40,6 @@ class SchemaSpecs:
         self.nodes_with_owner = ["groups", "exposures"]
         # Cache dict config analysis
         self._dict_config_cache = None
-        self._schema_version = version
 
     def _get_specs(
         self, version: Optional[str] = None
@@ -48,6 +51,7 @@ class SchemaSpecs:
             version = get_fusion_latest_version(self.disable_ssl_verification)
         yml_schema = get_fusion_yml_schema(version, self.disable_ssl_verification)
         dbt_project_schema = get_fusion_dbt_project_schema(version, self.disable_ssl_verification)
+        self._dbt_project_schema = dbt_project_schema
 
         valid_top_level_yaml_fields = list(yml_schema["properties"].keys())
 
@@ -259,9 +263,8 @@ class SchemaSpecs:
                 - 'open_ended': set of config names that accept any key-value pairs
         """
         if self._dict_config_cache is None:
-            # Get the schema
-            version = self._schema_version or get_fusion_latest_version(self.disable_ssl_verification)
-            schema = get_fusion_dbt_project_schema(version, self.disable_ssl_verification)
+            # Reuse the schema downloaded when the specs were built instead of fetching it again
+            schema = self._dbt_project_schema
 
             specific_properties = {}
             open_ended = set()
@@ -320,24 +323,69 @@ def get_fusion_latest_version(disable_ssl_verification: bool = False) -> str:
     return resp.json()["latest"]["tag"]
 
 
-def get_fusion_yml_schema(version: str, disable_ssl_verification: bool = False) -> dict:
-    yml_schema_url = f"https://public.cdn.getdbt.com/fs/schemas/fs-schema-dbt-yaml-files-{version}.json"
+def get_schema_cache_dir() -> Path:
+    """Directory where downloaded Fusion schemas are cached, under $XDG_CACHE_HOME or ~/.cache."""
+    return Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "dbt-autofix"
 
-    logging.info(f"Getting fusion yml schema for version {version}: {yml_schema_url}")
-    response = httpx.get(yml_schema_url, verify=not disable_ssl_verification)
+
+# for some reason the yml schema response holds 2 different schemas, the one we use comes after this separator
+SCHEMA_SEPARATOR = "----------------------------------------------"
+
+
+def _parse_schema_text(schema_text: str) -> dict:
+    return json.loads(schema_text.rsplit(SCHEMA_SEPARATOR, 1)[-1])
+
+
+def fetch_schema(schema_url: str, disable_ssl_verification: bool = False) -> dict:
+    """Download and parse a versioned Fusion schema, reusing the copy cached on disk by a previous run.
+
+    Schema URLs include the Fusion version and never change once published, so the cached
+    file is used as long as it parses, otherwise it is discarded and downloaded again.
+    Set DBT_AUTOFIX_NO_CACHE to always download it again.
+    """
+    cache_file = get_schema_cache_dir() / schema_url.rsplit("/", 1)[-1]
+    if not os.getenv("DBT_AUTOFIX_NO_CACHE"):
+        try:
+            return _parse_schema_text(cache_file.read_text())
+        except OSError:
+            pass
+        except ValueError:
+            logging.info(f"Discarding corrupt cached schema {cache_file}")
+            cache_file.unlink(missing_ok=True)
+
+    response = httpx.get(schema_url, verify=not disable_ssl_verification)
     response.raise_for_status()
+    schema = _parse_schema_text(response.text)
+
+    # the cache is best effort, a read-only home directory shouldn't stop the run
+    tmp_file_name = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # write next to the target and rename, so a concurrent run never reads a partial file
+        with tempfile.NamedTemporaryFile("w", dir=cache_file.parent, suffix=".tmp", delete=False) as tmp_file:
+            tmp_file_name = tmp_file.name
+            tmp_file.write(response.text)
+        os.replace(tmp_file_name, cache_file)
+        tmp_file_name = None
+    except OSError as e:
+        logging.info(f"Could not cache schema {schema_url}: {e}")
+    finally:
+        # don't leave a partial file behind when the write or the rename failed
+        if tmp_file_name is not None:
+            Path(tmp_file_name).unlink(missing_ok=True)
+
+    return schema
 
-    # for some reason we have 2 different schemas now in the response
-    response_split = response.text.split("----------------------------------------------")
 
-    return json.loads(response_split[-1])
+def get_fusion_yml_schema(version: str, disable_ssl_verification: bool = False) -> dict:
+    yml_schema_url = f"https://public.cdn.getdbt.com/fs/schemas/fs-schema-dbt-yaml-files-{version}.json"
+
+    logging.info(f"Getting fusion yml schema for version {version}: {yml_schema_url}")
+    return fetch_schema(yml_schema_url, disable_ssl_verification)
 
 
 def get_fusion_dbt_project_schema(version: str, disable_ssl_verification: bool = False) -> dict:
     dbt_project_schema_url = f"https://public.cdn.getdbt.com/fs/schemas/fs-schema-dbt-project-{version}.json"
 
     logging.info(f"Getting fusion dbt project schema for version {version}: {dbt_project_schema_url}")
-    response = httpx.get(dbt_project_schema_url, verify=not disable_ssl_verification)
-    response.raise_for_status()
-
-    return response.json()
+    return fetch_schema(dbt_project_schema_url, disable_ssl_verification)
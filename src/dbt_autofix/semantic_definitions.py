@@ -5,8 +5,27 @@ from typing_extensions import Self
 from dbt_autofix.refactors.yml import DbtYAML
 from dbt_autofix.jinja import statically_parse_ref
 
+YAML_FILE_EXTENSIONS: Tuple[str, str] = (".yml", ".yaml")
+
+
+def _find_yaml_files(path: Path) -> Set[Path]:
+    """Find all YAML files under path with a single directory walk."""
+    return {file for file in path.resolve().glob("**/*") if file.name.endswith(YAML_FILE_EXTENSIONS)}
+
 
 class SemanticDefinitions:
+    __slots__ = (
+        "_artificial_metric_names_map",
+        "_merged_measures",
+        "_semantic_model_to_dbt_model_name_map",
+        "_set_of_artificial_metric_names",
+        "initial_metrics",
+        "merged_metrics",
+        "merged_semantic_models",
+        "model_yml_keys",
+        "semantic_models",
+    )
+
     def __init__(self, root_path: Path, dbt_paths: List[str]):
         # All semantic models from semantic_models: entries in schema.yml files, keyed by their model key
         self.semantic_models: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = self.collect_semantic_models(
@@ -86,9 +105,7 @@ class SemanticDefinitions:
     ) -> Dict[Tuple[str, Optional[str]], Dict[str, Any]]:
         semantic_models: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
         for dbt_path in dbt_paths:
-            yaml_files = set((root_path / Path(dbt_path)).resolve().glob("**/*.yml")).union(
-                set((root_path / Path(dbt_path)).resolve().glob("**/*.yaml"))
-            )
+            yaml_files = _find_yaml_files(root_path / Path(dbt_path))
             for yml_file in yaml_files:
                 yml_str = yml_file.read_text()
                 yml_dict = DbtYAML().load(yml_str) or {}
@@ -102,9 +119,7 @@ class SemanticDefinitions:
     def collect_model_yml_keys(self, root_path: Path, dbt_paths: List[str]) -> Set[Tuple[str, Optional[str]]]:
         model_keys: Set[Tuple[str, Optional[str]]] = set()
         for dbt_path in dbt_paths:
-            yaml_files = set((root_path / Path(dbt_path)).resolve().glob("**/*.yml")).union(
-                set((root_path / Path(dbt_path)).resolve().glob("**/*.yaml"))
-            )
+            yaml_files = _find_yaml_files(root_path / Path(dbt_path))
             for yml_file in yaml_files:
                 yml_str = yml_file.read_text()
                 yml_dict = DbtYAML().load(yml_str) or {}
@@ -121,9 +136,7 @@ class SemanticDefinitions:
         """Returns dict of metric_name -> metric"""
         metrics: Dict[str, Dict[str, Any]] = {}
         for dbt_path in dbt_paths:
-            yaml_files = set((root_path / Path(dbt_path)).resolve().glob("**/*.yml")).union(
-                set((root_path / Path(dbt_path)).resolve().glob("**/*.yaml"))
-            )
+            yaml_files = _find_yaml_files(root_path / Path(dbt_path))
             for yml_file in sorted(yaml_files):
                 yml_str = yml_file.read_text()
                 yml_dict = DbtYAML().load(yml_str) or {}
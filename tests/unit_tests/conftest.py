@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+
+from dbt_autofix.retrieve_schemas import SchemaSpecs
+
+
+@pytest.fixture(scope="session")
+def real_schema() -> SchemaSpecs:
+    """
+    Provides REAL dbt Fusion schema specs.
+    The schemas are fetched from dbt Fusion once per test run and shared by all test modules.
+    """
+    return SchemaSpecs()
+
+
+@pytest.fixture(scope="session")
+def models_node_fields(real_schema: SchemaSpecs):
+    """
+    Provides the real node fields for models from dbt Fusion schema.
+    This tells us what config keys are actually valid for models in dbt_project.yml.
+    """
+    return real_schema.dbtproject_specs_per_node_type["models"]
+
+
+@pytest.fixture(scope="session")
+def temp_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provides an empty directory for path validation, tests only check paths against it and never write to it"""
+    return tmp_path_factory.mktemp("project_path")
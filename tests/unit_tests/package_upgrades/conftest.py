@@ -0,0 +1,142 @@
+from pathlib import Path
+from typing import Literal
+
+import pytest
+
+DBT_PROJECT_YML = """
+packages-install-path: dbt_packages
+"""
+
+PROJECT_SCHEMA_YML = """
+version: 2
+
+models:
+  - name: model1
+    description: "First model"
+    name: other_name
+  - name: model2
+    description: "Second model"
+"""
+
+PACKAGES_YML = """
+packages:
+  - package: dbt-labs/dbt_external_tables
+    version: [">=0.8.0", "<0.9.0"]
+
+  - package: dbt-labs/dbt_utils
+    version: [">=0.9.0", "<1.0.0"]
+
+  - package: dbt-labs/codegen
+    version: [">=0.8.0", "<0.9.0"]
+
+  - package: dbt-labs/audit_helper
+    version: [">=0.6.0", "<0.7.0"]
+
+  - package: metaplane/dbt_expectations
+    version: [">=0.10.8", "<1.0.0"]
+
+  - git: "https://github.com/PrivateGitRepoPackage/gmi_common_dbt_utils.git"
+    revision: main # use a branch or a tag name
+"""
+
+DEPENDENCIES_YML = (
+    """
+projects:
+  - name: first_other_project
+  - name: second_other_project"""
+    + PACKAGES_YML
+)
+
+PACKAGE_LOCK_YML = """
+packages:
+  - name: dbt_external_tables
+    package: dbt-labs/dbt_external_tables
+    version: 0.8.7
+  - name: dbt_utils
+    package: dbt-labs/dbt_utils
+    version: 0.9.6
+  - name: codegen
+    package: dbt-labs/codegen
+    version: 0.8.1
+  - name: audit_helper
+    package: dbt-labs/audit_helper
+    version: 0.6.0
+  - name: dbt_expectations
+    package: metaplane/dbt_expectations
+    version: 0.10.9
+  - git: https://github.com/PrivateGitRepoPackage/gmi_common_dbt_utils.git
+    name: gmi_common_dbt_utils
+    revision: 067b588343e9c19dc8593b6b3cb06cc5b47822e1
+  - name: dbt_date
+    package: godatadriven/dbt_date
+    version: 0.16.1
+sha1_hash: f10149243aadecf4a289805e5892180d9fc50142
+
+"""
+
+INSTALLED_PACKAGE_SCHEMA_YML = """
+version: 2
+
+models:
+  - name: package_model1
+    description: "First package model"
+  - name: package_model2
+    name: package_model3
+    description: "Duplicate package model"
+"""
+
+INTEGRATION_TESTS_SCHEMA_YML = """
+version: 2
+
+models:
+  - name: integration_model1
+    description: "First integration model"
+    description: "First integration model duplicate"
+  - name: integration_model2
+    description: "Duplicate integration model"
+
+"""
+
+
+def write_files(root: Path, files: dict[str, str]) -> None:
+    """Write each relative path in files under root with its content."""
+    file_paths = {root / relative_path: content for relative_path, content in files.items()}
+
+    # Only create the deepest directories, their parents are created along the way
+    directories = {file_path.parent for file_path in file_paths}
+    for directory in directories - {parent for directory in directories for parent in directory.parents}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    for file_path, content in file_paths.items():
+        file_path.write_text(content)
+
+
+def build_project_tree(project_dir: Path, manifest: Literal["packages", "dependencies"]) -> Path:
+    """Write a dbt project with one installed package, declaring its dependencies in packages.yml or dependencies.yml."""
+    manifest_file = {
+        "packages": ("packages.yml", PACKAGES_YML),
+        "dependencies": ("dependencies.yml", DEPENDENCIES_YML),
+    }[manifest]
+    write_files(
+        project_dir,
+        {
+            "dbt_project.yml": DBT_PROJECT_YML,
+            "models/schema.yml": PROJECT_SCHEMA_YML,
+            manifest_file[0]: manifest_file[1],
+            "package-lock.yml": PACKAGE_LOCK_YML,
+            "dbt_packages/test_package/models/schema.yml": INSTALLED_PACKAGE_SCHEMA_YML,
+            # integration tests of installed packages should be ignored
+            "dbt_packages/test_package/integration_tests/schema.yml": INTEGRATION_TESTS_SCHEMA_YML,
+        },
+    )
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def temp_project_dir_with_packages_yml(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return build_project_tree(tmp_path_factory.mktemp("project"), "packages")
+
+
+@pytest.fixture(scope="session")
+def temp_project_dir_with_dependencies_yml(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return build_project_tree(tmp_path_factory.mktemp("project"), "dependencies")
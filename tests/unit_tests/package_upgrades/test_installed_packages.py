@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from dbt_autofix.packages.installed_packages import (
+    load_yaml_from_package_dbt_project_yml_path,
+    parse_package_info_from_package_dbt_project_yml,
+)
+from dbt_autofix.refactors.yml import read_file
+
+
+@pytest.mark.parametrize(
+    "dbt_project_yml",
+    [
+        # unquoted versions that YAML reads as numbers
+        "name: dbt_utils\nversion: 1.0\nrequire-dbt-version: 1.5\n",
+        "name: dbt_utils\nversion: 1\n",
+        "name: dbt_utils\nversion: '1.1.0'\nrequire-dbt-version: ['>=1.3.0', '<2.0.0']\n",
+        'name: dbt_utils\nversion: 1.1.0\nrequire-dbt-version: ">=1.3.0"\n',
+    ],
+)
+def test_package_info_matches_round_trip_loader(tmp_path: Path, dbt_project_yml: str):
+    project_yml_path = tmp_path / "dbt_project.yml"
+    project_yml_path.write_text(dbt_project_yml)
+
+    package_info = parse_package_info_from_package_dbt_project_yml(
+        load_yaml_from_package_dbt_project_yml_path(project_yml_path)
+    )
+    # the same file read with the ruamel loader used before
+    round_trip_package_info = parse_package_info_from_package_dbt_project_yml(read_file(project_yml_path))
+
+    assert package_info is not None and round_trip_package_info is not None
+    assert package_info.package_name == round_trip_package_info.package_name
+    assert package_info.package_version_str == round_trip_package_info.package_version_str
+    assert package_info.require_dbt_version_range == round_trip_package_info.require_dbt_version_range
+
+
+def test_package_info_duplicate_keys(tmp_path: Path):
+    project_yml_path = tmp_path / "dbt_project.yml"
+    project_yml_path.write_text("name: dbt_utils\nversion: 1.0.0\nversion: 1.1.0\n")
+
+    package_info = parse_package_info_from_package_dbt_project_yml(
+        load_yaml_from_package_dbt_project_yml_path(project_yml_path)
+    )
+    # the last occurrence of a repeated key wins
+    assert package_info is not None
+    assert package_info.package_version_str == "1.1.0"
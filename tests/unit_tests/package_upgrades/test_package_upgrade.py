@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 from typing import Optional
 import pytest
@@ -51,94 +52,119 @@ PROJECT_DEPENDENCY_COUNT = 10
 # version is compatible based on require dbt version but has version override
 # dbt_project_evaluator: upgrade to 1.1.1
 
+# expected (installed version, package) Fusion compatibility for each dependency
+EXPECTED_FUSION_COMPATIBILITY_STATES: dict[
+    str, tuple[PackageVersionFusionCompatibilityState, PackageFusionCompatibilityState]
+] = {
+    "dbt-labs/dbt_utils": (
+        PackageVersionFusionCompatibilityState.EXPLICIT_ALLOW,
+        PackageFusionCompatibilityState.ALL_VERSIONS_COMPATIBLE,
+    ),
+    "dbt-labs/snowplow": (
+        PackageVersionFusionCompatibilityState.DBT_VERSION_RANGE_INCLUDES_2_0,
+        PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE,
+    ),
+    "dbt-labs/logging": (
+        PackageVersionFusionCompatibilityState.EXPLICIT_DISALLOW,
+        PackageFusionCompatibilityState.NO_VERSIONS_COMPATIBLE,
+    ),
+    "Matts52/dbt_set_similarity": (
+        PackageVersionFusionCompatibilityState.DBT_VERSION_RANGE_EXCLUDES_2_0,
+        PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE,
+    ),
+    "Matts52/dbt_stat_test": (
+        PackageVersionFusionCompatibilityState.DBT_VERSION_RANGE_EXCLUDES_2_0,
+        PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE,
+    ),
+    "avohq/avo_audit": (
+        PackageVersionFusionCompatibilityState.NO_DBT_VERSION_RANGE,
+        PackageFusionCompatibilityState.MISSING_COMPATIBILITY,
+    ),
+    "MaterializeInc/materialize_dbt_utils": (
+        PackageVersionFusionCompatibilityState.DBT_VERSION_RANGE_EXCLUDES_2_0,
+        PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE,
+    ),
+    "dbt-labs/dbt_project_evaluator": (
+        PackageVersionFusionCompatibilityState.EXPLICIT_DISALLOW,
+        PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE,
+    ),
+    "calogica/dbt_date": (
+        PackageVersionFusionCompatibilityState.EXPLICIT_ALLOW,
+        PackageFusionCompatibilityState.ALL_VERSIONS_COMPATIBLE,
+    ),
+    "brooklyn-data/dbt_artifacts": (
+        PackageVersionFusionCompatibilityState.EXPLICIT_DISALLOW,
+        PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE,
+    ),
+}
+
+# expected upgrade type for each dependency
+EXPECTED_UPGRADE_TYPES: dict[str, PackageVersionUpgradeType] = {
+    "dbt-labs/dbt_utils": PackageVersionUpgradeType.NO_UPGRADE_REQUIRED,
+    "dbt-labs/snowplow": PackageVersionUpgradeType.NO_UPGRADE_REQUIRED,
+    "dbt-labs/logging": PackageVersionUpgradeType.PUBLIC_PACKAGE_NOT_COMPATIBLE_WITH_FUSION,
+    "Matts52/dbt_set_similarity": PackageVersionUpgradeType.UPGRADE_AVAILABLE,
+    "Matts52/dbt_stat_test": PackageVersionUpgradeType.PUBLIC_PACKAGE_FUSION_COMPATIBLE_VERSION_EXCEEDS_PROJECT_CONFIG,
+    "avohq/avo_audit": PackageVersionUpgradeType.PUBLIC_PACKAGE_MISSING_FUSION_ELIGIBILITY,
+    "MaterializeInc/materialize_dbt_utils": PackageVersionUpgradeType.PUBLIC_PACKAGE_NOT_COMPATIBLE_WITH_FUSION,
+    "dbt-labs/dbt_project_evaluator": PackageVersionUpgradeType.PUBLIC_PACKAGE_FUSION_COMPATIBLE_VERSION_EXCEEDS_PROJECT_CONFIG,
+    "calogica/dbt_date": PackageVersionUpgradeType.NO_UPGRADE_REQUIRED,
+    "brooklyn-data/dbt_artifacts": PackageVersionUpgradeType.PUBLIC_PACKAGE_FUSION_COMPATIBLE_VERSION_EXCEEDS_PROJECT_CONFIG,
+}
+
+
+# generating dependencies only reads the project, so share it across tests
+@pytest.fixture(scope="session")
+def package_file() -> DbtPackageFile:
+    package_file: Optional[DbtPackageFile] = generate_package_dependencies(PROJECT_WITH_PACKAGES_PATH)
+    assert package_file is not None
+    return package_file
+
+
+# upgrade_package_versions updates the results it is given, so each test checks upgrades afresh
+@pytest.fixture
+def upgrades(package_file: DbtPackageFile) -> list[PackageVersionUpgradeResult]:
+    return check_for_package_upgrades(package_file)
+
+
+def assert_printed_output(output: PackageUpgradeResult, capsys: pytest.CaptureFixture[str]):
+    """Print the result both ways and check the captured output matches it."""
+    # drop the dry run diff printed by upgrade_package_versions
+    capsys.readouterr()
+    output.print_to_console(json_output=False)
+    printed_text = capsys.readouterr().out
+    for result in output.upgrades + output.unchanged:
+        assert result.id in printed_text
+
+    output.print_to_console(json_output=True)
+    printed = json.loads(capsys.readouterr().out)
+    assert len(printed["upgrades"]) == len(output.upgrades)
+    assert len(printed["unchanged"]) == len(output.unchanged)
 
-def test_generate_package_dependencies():
-    output: Optional[DbtPackageFile] = generate_package_dependencies(PROJECT_WITH_PACKAGES_PATH)
-    assert output is not None
+
+def test_generate_package_dependencies(package_file: DbtPackageFile):
+    output = package_file
     assert len(output.package_dependencies) == PROJECT_DEPENDENCY_COUNT
     assert len(output.get_private_package_names()) == 0
-    for package in output.package_dependencies:
-        assert output.package_dependencies[package].get_installed_package_version() != "unknown"
-        fusion_compatibility_state = output.package_dependencies[package].is_installed_version_fusion_compatible()
-        package_fusion_compatibility_state: PackageFusionCompatibilityState = output.package_dependencies[
-            package
-        ].get_package_fusion_compatibility_state()
-        if package == "dbt-labs/dbt_utils":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.EXPLICIT_ALLOW
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.ALL_VERSIONS_COMPATIBLE
-        elif package == "dbt-labs/snowplow":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.DBT_VERSION_RANGE_INCLUDES_2_0
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE
-        elif package == "dbt-labs/logging":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.EXPLICIT_DISALLOW
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.NO_VERSIONS_COMPATIBLE
-        elif package == "Matts52/dbt_set_similarity":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.DBT_VERSION_RANGE_EXCLUDES_2_0
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE
-        elif package == "Matts52/dbt_stat_test":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.DBT_VERSION_RANGE_EXCLUDES_2_0
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE
-        elif package == "avohq/avo_audit":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.NO_DBT_VERSION_RANGE
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.MISSING_COMPATIBILITY
-        elif package == "MaterializeInc/materialize_dbt_utils":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.DBT_VERSION_RANGE_EXCLUDES_2_0
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE
-        elif package == "dbt-labs/dbt_project_evaluator":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.EXPLICIT_DISALLOW
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE
-        elif package == "calogica/dbt_date":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.EXPLICIT_ALLOW
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.ALL_VERSIONS_COMPATIBLE
-        elif package == "brooklyn-data/dbt_artifacts":
-            assert fusion_compatibility_state == PackageVersionFusionCompatibilityState.EXPLICIT_DISALLOW
-            assert package_fusion_compatibility_state == PackageFusionCompatibilityState.SOME_VERSIONS_COMPATIBLE
-
-
-def test_check_for_package_upgrades():
-    package_file: Optional[DbtPackageFile] = generate_package_dependencies(PROJECT_WITH_PACKAGES_PATH)
-    assert package_file is not None
-    output: list[PackageVersionUpgradeResult] = check_for_package_upgrades(package_file)
+    for package in output.package_dependencies.values():
+        assert package.get_installed_package_version() != "unknown"
+    fusion_compatibility_states = {
+        package_id: (package.is_installed_version_fusion_compatible(), package.get_package_fusion_compatibility_state())
+        for package_id, package in output.package_dependencies.items()
+    }
+    assert fusion_compatibility_states == EXPECTED_FUSION_COMPATIBILITY_STATES
+
+
+def test_check_for_package_upgrades(upgrades: list[PackageVersionUpgradeResult]):
+    output = upgrades
     assert len(output) == PROJECT_DEPENDENCY_COUNT
-    for package_result in output:
-        print(f"test output: {package_result.id}, {package_result.version_reason}")
-        package = package_result.id
-        fusion_compatibility_state = package_result.version_reason
-        if package == "dbt-labs/dbt_utils":
-            assert fusion_compatibility_state == PackageVersionUpgradeType.NO_UPGRADE_REQUIRED
-        elif package == "dbt-labs/snowplow":
-            assert fusion_compatibility_state == PackageVersionUpgradeType.NO_UPGRADE_REQUIRED
-        elif package == "dbt-labs/logging":
-            assert fusion_compatibility_state == PackageVersionUpgradeType.PUBLIC_PACKAGE_NOT_COMPATIBLE_WITH_FUSION
-        elif package == "Matts52/dbt_set_similarity":
-            assert fusion_compatibility_state == PackageVersionUpgradeType.UPGRADE_AVAILABLE
-        elif package == "Matts52/dbt_stat_test":
-            assert (
-                fusion_compatibility_state
-                == PackageVersionUpgradeType.PUBLIC_PACKAGE_FUSION_COMPATIBLE_VERSION_EXCEEDS_PROJECT_CONFIG
-            )
-        elif package == "avohq/avo_audit":
-            assert fusion_compatibility_state == PackageVersionUpgradeType.PUBLIC_PACKAGE_MISSING_FUSION_ELIGIBILITY
-        elif package == "MaterializeInc/materialize_dbt_utils":
-            assert fusion_compatibility_state == PackageVersionUpgradeType.PUBLIC_PACKAGE_NOT_COMPATIBLE_WITH_FUSION
-        elif package == "dbt-labs/dbt_project_evaluator":
-            assert (
-                fusion_compatibility_state
-                == PackageVersionUpgradeType.PUBLIC_PACKAGE_FUSION_COMPATIBLE_VERSION_EXCEEDS_PROJECT_CONFIG
-            )
-        elif package == "calogica/dbt_date":
-            assert fusion_compatibility_state == PackageVersionUpgradeType.NO_UPGRADE_REQUIRED
-        elif package == "brooklyn-data/dbt_artifacts":
-            assert (
-                fusion_compatibility_state
-                == PackageVersionUpgradeType.PUBLIC_PACKAGE_FUSION_COMPATIBLE_VERSION_EXCEEDS_PROJECT_CONFIG
-            )
-
-
-def test_upgrade_package_versions_no_force_update():
-    package_file: Optional[DbtPackageFile] = generate_package_dependencies(PROJECT_WITH_PACKAGES_PATH)
-    assert package_file is not None
-    upgrades: list[PackageVersionUpgradeResult] = check_for_package_upgrades(package_file)
+    upgrade_types = {package_result.id: package_result.version_reason for package_result in output}
+    assert upgrade_types == EXPECTED_UPGRADE_TYPES
+
+
+def test_upgrade_package_versions_no_force_update(
+    package_file: DbtPackageFile, upgrades: list[PackageVersionUpgradeResult], capsys: pytest.CaptureFixture[str]
+):
     assert len(upgrades) == PROJECT_DEPENDENCY_COUNT
     output: PackageUpgradeResult = upgrade_package_versions(
         package_file, upgrades, dry_run=True, override_pinned_version=False
@@ -148,14 +174,12 @@ def test_upgrade_package_versions_no_force_update():
     assert len(output.upgrades) == 1
     assert len(output.unchanged) == 9
     assert len(output.upgrades) + len(output.unchanged) == PROJECT_DEPENDENCY_COUNT
-    output.print_to_console(json_output=False)
-    output.print_to_console(json_output=True)
+    assert_printed_output(output, capsys)
 
 
-def test_upgrade_package_versions_with_force_update():
-    package_file: Optional[DbtPackageFile] = generate_package_dependencies(PROJECT_WITH_PACKAGES_PATH)
-    assert package_file is not None
-    upgrades: list[PackageVersionUpgradeResult] = check_for_package_upgrades(package_file)
+def test_upgrade_package_versions_with_force_update(
+    package_file: DbtPackageFile, upgrades: list[PackageVersionUpgradeResult], capsys: pytest.CaptureFixture[str]
+):
     assert len(upgrades) == PROJECT_DEPENDENCY_COUNT
     output: PackageUpgradeResult = upgrade_package_versions(
         package_file, upgrades, dry_run=True, override_pinned_version=True
@@ -165,5 +189,4 @@ def test_upgrade_package_versions_with_force_update():
     assert len(output.upgrades) == 4
     assert len(output.unchanged) == 6
     assert len(output.upgrades) + len(output.unchanged) == PROJECT_DEPENDENCY_COUNT
-    output.print_to_console(json_output=False)
-    output.print_to_console(json_output=True)
+    assert_printed_output(output, capsys)
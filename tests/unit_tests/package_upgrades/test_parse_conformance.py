@@ -1,22 +1,43 @@
 from pathlib import Path
+
+import pytest
+
 from dbt_fusion_package_tools.check_parse_conformance import (
     check_fusion_schema_compatibility,
     checkout_repo_and_run_conformance,
+    find_fusion_binary,
 )
 
 
-def test_fusion_schema_compat():
-    output = check_fusion_schema_compatibility(
-        Path("tests/integration_tests/package_upgrades/dbt_utils_package_lookup_map_2")
-    )
-    print(output)
-    print()
-    print(
-        check_fusion_schema_compatibility(
-            Path("tests/integration_tests/package_upgrades/dbt_utils_package_lookup_map_2"), show_fusion_output=False
-        )
+@pytest.mark.slow
+@pytest.mark.parametrize("show_fusion_output", [True, False])
+def test_fusion_schema_compat(show_fusion_output: bool):
+    if find_fusion_binary() is None:
+        pytest.skip("Fusion binary not available")
+
+    result = check_fusion_schema_compatibility(
+        Path("tests/integration_tests/package_upgrades/dbt_utils_package_lookup_map_2"),
+        show_fusion_output=show_fusion_output,
     )
 
+    # None means dbt deps/parse could not be run or their output could not be read
+    assert result is not None
+    # parse exits non-zero exactly when the invocation reports errors
+    assert (result.parse_exit_code == 0) == (result.total_errors == 0)
+    # every error logged by parse is counted by the invocation
+    assert result.total_errors >= len(result.errors)
+
 
-def test_checkout_repo_and_run_conformance():
-    checkout_repo_and_run_conformance("dbt-labs", "dbt-project-evaluator", "dbt_project_evaluator", limit=1)
+@pytest.mark.slow
+def test_checkout_repo_and_run_conformance(pytestconfig: pytest.Config, tmp_path_factory: pytest.TempPathFactory):
+    # keep the clone in pytest's cache so later runs don't clone the repo again,
+    # the cache isn't there when running with -p no:cacheprovider
+    cache = getattr(pytestconfig, "cache", None)
+    cache_dir = cache.mkdir("conformance_repos") if cache is not None else tmp_path_factory.mktemp("conformance_repos")
+    checkout_repo_and_run_conformance(
+        "dbt-labs",
+        "dbt-project-evaluator",
+        "dbt_project_evaluator",
+        limit=1,
+        cache_dir=cache_dir,
+    )
@@ -6,6 +6,9 @@ from dbt_fusion_package_tools.version_utils import (
     VersionRange,
     VersionSpecifier,
     UnboundedVersionSpecifier,
+    _VERSION_REGEX,
+    _parse_plain_version_string,
+    Matchers,
 )
 
 import pytest
@@ -45,9 +48,54 @@ def test_convert_string_to_range():
     lower_bound_only = VersionSpecifier.from_version_string(">1.0.0")
     upper_bound_only_range = VersionRange(upper_bound_only, upper_bound_only)
     lower_bound_only_range = VersionRange(lower_bound_only, lower_bound_only)
-    print(upper_bound_only_range)
-    print(lower_bound_only_range)
-    print(upper_bound_only_range.to_version_string_pair())
-    print(upper_bound_only.to_range())
-    print(lower_bound_only.to_range())
+    assert str(upper_bound_only_range) == "<1.0.0, <1.0.0"
+    assert str(lower_bound_only_range) == ">1.0.0, >1.0.0"
+    assert upper_bound_only_range.to_version_string_pair() == ["<1.0.0", "<1.0.0"]
+    assert str(upper_bound_only.to_range()) == "<1.0.0"
+    assert str(lower_bound_only.to_range()) == ">1.0.0"
     # print(VersionRange(UnboundedVersionSpecifier(), ))
+
+
+@pytest.mark.parametrize(
+    "version_string,takes_fast_path",
+    [
+        ("1.2.3", True),
+        ("0.0.0", True),
+        (">=1.10.0", True),
+        ("<=0.9.12", True),
+        ("=1.0.0", True),
+        # leading zeros aren't valid semver
+        ("01.2.3", False),
+        ("1.02.3", False),
+        ("1.2.03", False),
+        # missing or extra parts
+        ("1.2", False),
+        ("1", False),
+        ("1.2.3.4", False),
+        ("1..3", False),
+        ("", False),
+        (">=", False),
+        # prerelease and build suffixes
+        ("1.2.3-rc1", False),
+        ("1.2.3rc1", False),
+        ("1.2.3-b.1+exp.sha", False),
+        ("1.2.3+build", False),
+        (">1.2.3-", False),
+        ("1.2.x", False),
+    ],
+)
+def test_plain_version_fast_path_matches_regex(version_string: str, takes_fast_path: bool):
+    parsed = _parse_plain_version_string(version_string)
+    assert (parsed is not None) == takes_fast_path
+
+    match = _VERSION_REGEX.match(version_string)
+    if parsed is not None:
+        assert match is not None
+        assert parsed == (
+            match.group("major"),
+            match.group("minor"),
+            match.group("patch"),
+            match.group("prerelease"),
+            match.group("build"),
+            Matchers(match.group("matcher") or Matchers.EXACT),
+        )
@@ -17,9 +17,17 @@ class MockSchemaSpecs:
         }
 
 
-def test_basic_config_get_refactor():
-    """Test basic config.get() refactoring."""
-    input_sql = """
+@pytest.fixture(scope="module")
+def mock_schema_specs() -> MockSchemaSpecs:
+    return MockSchemaSpecs()
+
+
+# (input SQL, expected SQL, number of refactored calls) for cases where every custom
+# config access is rewritten in place; add new straightforward cases here
+REFACTOR_CASES = [
+    # Basic config.get() refactoring.
+    pytest.param(
+        """
 {{ config(
     materialized='table',
     custom_key='custom_value'
@@ -28,9 +36,8 @@ def test_basic_config_get_refactor():
 SELECT
     '{{ config.get('custom_key') }}' as custom,
     '{{ config.get('materialized') }}' as mat
-"""
-
-    expected_sql = """
+""",
+        """
 {{ config(
     materialized='table',
     custom_key='custom_value'
@@ -39,56 +46,120 @@ SELECT
 SELECT
     '{{ config.meta_get('custom_key') }}' as custom,
     '{{ config.get('materialized') }}' as mat
-"""
-
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
-
-    assert result.refactored
-    assert result.refactored_content == expected_sql
-    assert len(result.deprecation_refactors) == 1
-
-
-def test_config_get_with_default():
-    """Test config.get() with default value."""
-    input_sql = """
+""",
+        1,
+        id="basic_config_get",
+    ),
+    # config.get() with default value.
+    pytest.param(
+        """
 SELECT
     '{{ config.get('custom_key', 'default_value') }}' as custom,
     '{{ config.get('another_key', var('my_var')) }}' as another
-"""
-
-    expected_sql = """
+""",
+        """
 SELECT
     '{{ config.meta_get('custom_key', 'default_value') }}' as custom,
     '{{ config.meta_get('another_key', var('my_var')) }}' as another
-"""
+""",
+        2,
+        id="config_get_with_default",
+    ),
+    # config.require() refactoring.
+    pytest.param(
+        """
+{% set required_val = config.require('custom_required') %}
+{% set mat = config.require('materialized') %}
+""",
+        """
+{% set required_val = config.meta_require('custom_required') %}
+{% set mat = config.require('materialized') %}
+""",
+        1,
+        id="config_require",
+    ),
+    # Handling of mixed quote styles - preserves original quotes.
+    pytest.param(
+        """
+{{ config.get("custom_key1") }}
+{{ config.get('custom_key2') }}
+{{ config.get(  "custom_key3"  ) }}
+""",
+        """
+{{ config.meta_get("custom_key1") }}
+{{ config.meta_get('custom_key2') }}
+{{ config.meta_get(  "custom_key3"  ) }}
+""",
+        3,
+        id="mixed_quotes",
+    ),
+    # Handling of complex default values.
+    pytest.param(
+        """
+{{ config.get('custom_list', []) }}
+{{ config.get('custom_dict', {}) }}
+{{ config.get('custom_none', none) }}
+""",
+        """
+{{ config.meta_get('custom_list', []) }}
+{{ config.meta_get('custom_dict', {}) }}
+{{ config.meta_get('custom_none', none) }}
+""",
+        3,
+        id="complex_defaults",
+    ),
+    # Handling of multiline config calls - preserves formatting.
+    pytest.param(
+        """
+{{ config.get(
+    'custom_key',
+    'default_value'
+) }}
+""",
+        """
+{{ config.meta_get(
+    'custom_key',
+    'default_value'
+) }}
+""",
+        1,
+        id="multiline_config_calls",
+    ),
+    # config.get() with default= named parameter syntax and complex default values.
+    pytest.param(
+        """
+{{ config.get('custom_config', default='default_value') }}
 
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
+{{ config.get('custom_config', default=var.get('my_var')) }}
 
-    assert result.refactored
-    assert result.refactored_content == expected_sql
-    assert len(result.deprecation_refactors) == 2
+{{ config.get('custom_config', default=dest_columns | map(attribute="quoted") | list) }}
+""",
+        """
+{{ config.meta_get('custom_config', default='default_value') }}
 
+{{ config.meta_get('custom_config', default=var.get('my_var')) }}
 
-def test_config_require_refactor():
-    """Test config.require() refactoring."""
-    input_sql = """
-{% set required_val = config.require('custom_required') %}
-{% set mat = config.require('materialized') %}
-"""
+{{ config.meta_get('custom_config', default=dest_columns | map(attribute="quoted") | list) }}
+""",
+        3,
+        id="config_get_with_named_default_parameter",
+    ),
+]
 
-    expected_sql = """
-{% set required_val = config.meta_require('custom_required') %}
-{% set mat = config.require('materialized') %}
-"""
 
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
+@pytest.mark.parametrize("input_sql, expected_sql, expected_refactor_count", REFACTOR_CASES)
+def test_config_access_refactor(
+    mock_schema_specs: MockSchemaSpecs, input_sql: str, expected_sql: str, expected_refactor_count: int
+):
+    """Test config.get()/config.require() calls on custom keys are moved to meta_get()/meta_require()."""
+    result = move_custom_config_access_to_meta_sql_improved(input_sql, mock_schema_specs, "models")
 
     assert result.refactored
     assert result.refactored_content == expected_sql
-    assert len(result.deprecation_refactors) == 1
+    assert len(result.deprecation_refactors) == expected_refactor_count
 
 
-def test_config_with_validator():
+def test_config_with_validator(mock_schema_specs: MockSchemaSpecs):
     """Test that config with validators are now properly refactored."""
     input_sql = """
 {%- set file_format = config.get('custom_format', validator=validation.any[basestring]) -%}
@@ -98,7 +169,7 @@ def test_config_with_validator():
 {%- set file_format = config.meta_get('custom_format', validator=validation.any[basestring]) -%}
 """
 
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
+    result = move_custom_config_access_to_meta_sql_improved(input_sql, mock_schema_specs, "models")
 
     assert result.refactored
     assert result.refactored_content == expected_sql
@@ -106,7 +177,7 @@ def test_config_with_validator():
     assert len(result.deprecation_refactors) == 1
 
 
-def test_variable_shadowing_detection():
+def test_variable_shadowing_detection(mock_schema_specs: MockSchemaSpecs):
     """Test that variable shadowing is detected and skipped."""
     input_sql = """
 {% set config = my_custom_config %}
@@ -116,7 +187,7 @@ def test_variable_shadowing_detection():
     # Expected to remain unchanged due to shadowing
     expected_sql = input_sql
 
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
+    result = move_custom_config_access_to_meta_sql_improved(input_sql, mock_schema_specs, "models")
 
     assert not result.refactored
     assert result.refactored_content == expected_sql
@@ -124,7 +195,7 @@ def test_variable_shadowing_detection():
     assert "shadowing" in result.refactor_warnings[0]
 
 
-def test_chained_access_warning():
+def test_chained_access_warning(mock_schema_specs: MockSchemaSpecs):
     """Test that chained access patterns generate warnings."""
     input_sql = """
 {% set dict_val = config.get('custom_dict').subkey %}
@@ -136,7 +207,7 @@ def test_chained_access_warning():
 {% set another = config.meta_get('custom_dict').get('key', 'default') %}
 """
 
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
+    result = move_custom_config_access_to_meta_sql_improved(input_sql, mock_schema_specs, "models")
 
     assert result.refactored
     assert result.refactored_content == expected_sql
@@ -144,49 +215,7 @@ def test_chained_access_warning():
     assert len(result.deprecation_refactors) == 2
 
 
-def test_mixed_quotes():
-    """Test handling of mixed quote styles - preserves original quotes."""
-    input_sql = """
-{{ config.get("custom_key1") }}
-{{ config.get('custom_key2') }}
-{{ config.get(  "custom_key3"  ) }}
-"""
-
-    expected_sql = """
-{{ config.meta_get("custom_key1") }}
-{{ config.meta_get('custom_key2') }}
-{{ config.meta_get(  "custom_key3"  ) }}
-"""
-
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
-
-    assert result.refactored
-    assert result.refactored_content == expected_sql
-    assert len(result.deprecation_refactors) == 3
-
-
-def test_complex_defaults():
-    """Test handling of complex default values."""
-    input_sql = """
-{{ config.get('custom_list', []) }}
-{{ config.get('custom_dict', {}) }}
-{{ config.get('custom_none', none) }}
-"""
-
-    expected_sql = """
-{{ config.meta_get('custom_list', []) }}
-{{ config.meta_get('custom_dict', {}) }}
-{{ config.meta_get('custom_none', none) }}
-"""
-
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
-
-    assert result.refactored
-    assert result.refactored_content == expected_sql
-    assert len(result.deprecation_refactors) == 3
-
-
-def test_no_refactor_for_dbt_configs():
+def test_no_refactor_for_dbt_configs(mock_schema_specs: MockSchemaSpecs):
     """Test that dbt-native configs are not refactored."""
     input_sql = """
 {{ config.get('materialized') }}
@@ -198,56 +227,8 @@ def test_no_refactor_for_dbt_configs():
     # Expected to remain unchanged as these are dbt-native configs
     expected_sql = input_sql
 
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
+    result = move_custom_config_access_to_meta_sql_improved(input_sql, mock_schema_specs, "models")
 
     assert not result.refactored
     assert result.refactored_content == expected_sql
     assert len(result.deprecation_refactors) == 0
-
-
-def test_multiline_config_calls():
-    """Test handling of multiline config calls - preserves formatting."""
-    input_sql = """
-{{ config.get(
-    'custom_key',
-    'default_value'
-) }}
-"""
-
-    expected_sql = """
-{{ config.meta_get(
-    'custom_key',
-    'default_value'
-) }}
-"""
-
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
-
-    assert result.refactored
-    assert result.refactored_content == expected_sql
-    assert len(result.deprecation_refactors) == 1
-
-
-def test_config_get_with_named_default_parameter():
-    """Test config.get() with default= named parameter syntax and complex default values."""
-    input_sql = """
-{{ config.get('custom_config', default='default_value') }}
-
-{{ config.get('custom_config', default=var.get('my_var')) }}
-
-{{ config.get('custom_config', default=dest_columns | map(attribute="quoted") | list) }}
-"""
-
-    expected_sql = """
-{{ config.meta_get('custom_config', default='default_value') }}
-
-{{ config.meta_get('custom_config', default=var.get('my_var')) }}
-
-{{ config.meta_get('custom_config', default=dest_columns | map(attribute="quoted") | list) }}
-"""
-
-    result = move_custom_config_access_to_meta_sql_improved(input_sql, MockSchemaSpecs(), "models")
-
-    assert result.refactored
-    assert result.refactored_content == expected_sql
-    assert len(result.deprecation_refactors) == 3
@@ -1,31 +1,11 @@
 """Tests for dict config subkey validation - ensuring +prefixed subkeys are moved to +meta"""
 
-from pathlib import Path
-from tempfile import TemporaryDirectory
-
-import pytest
-
 from dbt_autofix.refactors.changesets.dbt_project_yml import rec_check_yaml_path
-from dbt_autofix.retrieve_schemas import SchemaSpecs
-
-
-@pytest.fixture(scope="module")
-def real_schema():
-    """Provides REAL dbt Fusion schema specs."""
-    return SchemaSpecs()
-
-
-@pytest.fixture
-def models_node_fields(real_schema):
-    """Provides the real node fields for models from dbt Fusion schema."""
-    return real_schema.dbtproject_specs_per_node_type["models"]
 
 
-@pytest.fixture
-def temp_path():
-    """Provides a temp directory for path validation"""
-    with TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def moved_to_meta_logged(logs: list[str], key: str) -> bool:
+    """Whether a single log line reports moving key to meta."""
+    return any(key in log and "meta" in log for log in logs)
 
 
 def test_persist_docs_with_plus_prefixed_subkeys(models_node_fields, temp_path, real_schema):
@@ -51,8 +31,8 @@ def test_persist_docs_with_plus_prefixed_subkeys(models_node_fields, temp_path,
 
     assert result == expected_output
     assert len(logs) == 2
-    assert any("+columns" in log and "meta" in log for log in logs)
-    assert any("+relation" in log and "meta" in log for log in logs)
+    assert moved_to_meta_logged(logs, "+columns")
+    assert moved_to_meta_logged(logs, "+relation")
 
 
 def test_persist_docs_with_correct_subkeys(models_node_fields, temp_path, real_schema):
@@ -105,8 +85,8 @@ def test_persist_docs_with_mixed_subkeys(models_node_fields, temp_path, real_sch
 
     assert result == expected_output
     assert len(logs) == 2
-    assert any("+relation" in log and "meta" in log for log in logs)
-    assert any("+invalid" in log and "meta" in log for log in logs)
+    assert moved_to_meta_logged(logs, "+relation")
+    assert moved_to_meta_logged(logs, "+invalid")
 
 
 def test_labels_with_plus_prefixed_subkeys(models_node_fields, temp_path, real_schema):
@@ -201,7 +181,7 @@ def test_multiple_dict_configs_with_various_subkeys(models_node_fields, temp_pat
 
     assert result == expected_output
     assert len(logs) == 1  # Only one move to meta
-    assert any("+columns" in log and "meta" in log for log in logs)
+    assert moved_to_meta_logged(logs, "+columns")
 
 
 def test_nested_logical_grouping_with_dict_configs(models_node_fields, temp_path, real_schema):
@@ -234,7 +214,7 @@ def test_nested_logical_grouping_with_dict_configs(models_node_fields, temp_path
 
     assert result == expected_output
     assert len(logs) == 1  # Only one for moving +columns to meta
-    assert any("+columns" in log and "meta" in log for log in logs)
+    assert moved_to_meta_logged(logs, "+columns")
 
 
 def test_empty_dict_after_moving_all_subkeys(models_node_fields, temp_path, real_schema):
@@ -6,50 +6,49 @@ import pytest
 
 from dbt_autofix.refactors.changesets.dbt_project_yml import changeset_fix_space_after_plus
 
+# Common valid config keys that should be recognized
+VALID_KEYS = frozenset(
+    {
+        "+tags",
+        "+materialized",
+        "+schema",
+        "+database",
+        "+enabled",
+        "+store_failures",
+        "+target_schema",
+        "+full_refresh",
+        "+grants",
+        "+alias",
+        "+pre-hook",
+        "+post-hook",
+        "+docs",
+        "+persist_docs",
+        "+column_types",
+        "+quote_columns",
+        "+on_schema_change",
+        "+contract",
+    }
+)
+
 
 @dataclass
 class MockDbtProjectSpecs:
     """Mock DbtProjectSpecs for testing"""
 
-    allowed_config_fields_dbt_project_with_plus: set[str]
+    allowed_config_fields_dbt_project_with_plus: frozenset[str]
 
 
 class MockSchemaSpecs:
     """Mock SchemaSpecs for testing"""
 
     def __init__(self):
-        # Common valid config keys that should be recognized
-        valid_keys = {
-            "+tags",
-            "+materialized",
-            "+schema",
-            "+database",
-            "+enabled",
-            "+store_failures",
-            "+target_schema",
-            "+full_refresh",
-            "+grants",
-            "+alias",
-            "+pre-hook",
-            "+post-hook",
-            "+docs",
-            "+persist_docs",
-            "+column_types",
-            "+quote_columns",
-            "+on_schema_change",
-            "+contract",
-        }
-
-        # Create mock specs for different node types (models, seeds, tests, snapshots, etc.)
-        self.dbtproject_specs_per_node_type = {
-            "models": MockDbtProjectSpecs(allowed_config_fields_dbt_project_with_plus=valid_keys),
-            "seeds": MockDbtProjectSpecs(allowed_config_fields_dbt_project_with_plus=valid_keys),
-            "tests": MockDbtProjectSpecs(allowed_config_fields_dbt_project_with_plus=valid_keys),
-            "snapshots": MockDbtProjectSpecs(allowed_config_fields_dbt_project_with_plus=valid_keys),
-        }
-
-
-@pytest.fixture
+        # All node types (models, seeds, tests, snapshots) accept the same keys, so they share one spec
+        node_specs = MockDbtProjectSpecs(allowed_config_fields_dbt_project_with_plus=VALID_KEYS)
+        self.dbtproject_specs_per_node_type = dict.fromkeys(("models", "seeds", "tests", "snapshots"), node_specs)
+
+
+# The specs are only read, so all tests in the module share one instance
+@pytest.fixture(scope="module")
 def schema_specs():
     """Fixture to provide mock schema specs for tests"""
     return MockSchemaSpecs()
@@ -14,7 +14,7 @@ This means:
 ✅ No need to keep mocks in sync with reality
 ✅ You can trust that these tests reflect real-world behavior
 
-The schema is fetched once per test run (module scope fixture) for efficiency.
+The schema is fetched once per test run (session scope fixture in conftest.py) for efficiency.
 
 🔧 LOGIC: Simple validation - no spelling correction!
 - If config is IN schema → keep it
@@ -22,39 +22,7 @@ The schema is fetched once per test run (module scope fixture) for efficiency.
 - No attempts to "fix" typos or rename configs
 """
 
-from pathlib import Path
-from tempfile import TemporaryDirectory
-
-import pytest
-
 from dbt_autofix.refactors.changesets.dbt_project_yml import rec_check_yaml_path
-from dbt_autofix.retrieve_schemas import SchemaSpecs
-
-
-@pytest.fixture(scope="module")
-def real_schema():
-    """
-    Provides REAL dbt Fusion schema specs.
-    This fetches the actual schema from dbt Fusion, so tests are accurate!
-    """
-    return SchemaSpecs()
-
-
-@pytest.fixture
-def models_node_fields(real_schema):
-    """
-    Provides the real node fields for models from dbt Fusion schema.
-    This tells us what config keys are actually valid for models in dbt_project.yml.
-    """
-    return real_schema.dbtproject_specs_per_node_type["models"]
-
-
-@pytest.fixture
-def temp_path():
-    """Provides a temp directory for path validation"""
-    with TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
 
 # =============================================================================
 # SCENARIO 1: Correct syntax - no changes needed
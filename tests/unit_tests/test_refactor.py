@@ -1,8 +1,7 @@
-import tempfile
 from pathlib import Path
+from typing import List, Optional
 
 import pytest
-from yaml import safe_load
 
 from dbt_autofix.refactor import (
     SQLRefactorResult,
@@ -25,35 +24,10 @@ from dbt_autofix.refactors.changesets.dbt_schema_yml import (
     changeset_replace_fancy_quotes,
 )
 from dbt_autofix.refactors.changesets.dbt_sql import CONFIG_MACRO_PATTERN, refactor_custom_configs_to_meta_sql
-from dbt_autofix.refactors.yml import dict_to_yaml_str
+from dbt_autofix.refactors.yml import dict_to_yaml_str, safe_load
 from dbt_autofix.retrieve_schemas import SchemaSpecs
 
-
-@pytest.fixture
-def temp_project_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        project_dir = Path(tmpdirname)
-
-        # Create dbt_project.yml
-        project_dir.joinpath("dbt_project.yml").write_text("""
-model-paths: ["models"]
-""")
-
-        # Create models directory
-        models_dir = project_dir / "models"
-        models_dir.mkdir(parents=True, exist_ok=True)
-
-        yield project_dir
-
-
-@pytest.fixture(scope="session")
-def schema_specs():
-    return SchemaSpecs()
-
-
-@pytest.fixture
-def schema_yml_with_duplicates():
-    return """
+SCHEMA_YML_WITH_DUPLICATES = """
 version: 2
 
 models:
@@ -92,9 +66,7 @@ models:
 """
 
 
-@pytest.fixture
-def schema_yml_with_config_fields():
-    return """
+SCHEMA_YML_WITH_CONFIG_FIELDS = """
 version: 2
 
 models:
@@ -114,9 +86,7 @@ models:
 """
 
 
-@pytest.fixture
-def schema_yml_with_fields_top_and_under_config():
-    return """
+SCHEMA_YML_WITH_FIELDS_TOP_AND_UNDER_CONFIG = """
 version: 2
 
 models:
@@ -138,9 +108,7 @@ models:
 """
 
 
-@pytest.fixture
-def schema_yml_with_close_matches():
-    return """
+SCHEMA_YML_WITH_CLOSE_MATCHES = """
 version: 2
 
 models:
@@ -160,9 +128,7 @@ models:
 """
 
 
-@pytest.fixture
-def schema_yml_with_nested_sources():
-    return """
+SCHEMA_YML_WITH_NESTED_SOURCES = """
 version: 2
 
 sources:
@@ -191,9 +157,7 @@ sources:
 """
 
 
-@pytest.fixture
-def schema_yml_with_owner_properties():
-    return """
+SCHEMA_YML_WITH_OWNER_PROPERTIES = """
 version: 2
 
 groups:
@@ -222,80 +186,199 @@ exposures:
 """
 
 
-class TestUnmatchedEndingsRemoval:
-    """Tests for remove_unmatched_endings function"""
+@pytest.fixture
+def temp_project_dir(tmp_path: Path):
+    project_dir = tmp_path
 
-    def test_basic_unmatched_endmacro(self):
-        sql_content = """
+    # Create dbt_project.yml
+    project_dir.joinpath("dbt_project.yml").write_text("""
+model-paths: ["models"]
+""")
+
+    # Create models directory
+    models_dir = project_dir / "models"
+    models_dir.mkdir(parents=True, exist_ok=True)
+
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def schema_specs(real_schema: SchemaSpecs) -> SchemaSpecs:
+    return real_schema
+
+
+UNMATCHED_ENDINGS_CASES = [
+    pytest.param(
+        """
         select *
         from my_table
         {% endmacro %}
         where x = 1
+        """,
+        "{% endmacro %}",
+        ["Removed unmatched {% endmacro %}"],
+        id="unmatched_endmacro",
+    ),
+    pytest.param(
         """
-        result = remove_unmatched_endings(sql_content)
-        assert "{% endmacro %}" not in result.refactored_content
-        assert len(result.deprecation_refactors) == 1
-        assert "Removed unmatched {% endmacro %}" in result.deprecation_refactors[0].log
-
-    def test_basic_unmatched_endif(self):
-        sql_content = """
         select *
         from my_table
         {% endif %}
         where x = 1
+        """,
+        "{% endif %}",
+        ["Removed unmatched {% endif %}"],
+        id="unmatched_endif",
+    ),
+    pytest.param(
         """
-        result = remove_unmatched_endings(sql_content)
-        assert "{% endif %}" not in result.refactored_content
-        assert len(result.deprecation_refactors) == 1
-        assert "Removed unmatched {% endif %}" in result.deprecation_refactors[0].log
-
-    def test_matched_macro(self):
-        sql_content = """
         {% macro my_macro() %}
         select *
         from my_table
         {% endmacro %}
+        """,
+        None,
+        [],
+        id="matched_macro",
+    ),
+    pytest.param(
         """
-        result = remove_unmatched_endings(sql_content)
-        assert "{% macro my_macro() %}" in result.refactored_content
-        assert "{% endmacro %}" in result.refactored_content
-        assert len(result.deprecation_refactors) == 0
-
-    def test_matched_if(self):
-        sql_content = """
         {% if condition %}
         select *
         from my_table
         {% endif %}
+        """,
+        None,
+        [],
+        id="matched_if",
+    ),
+    pytest.param(
         """
-        result = remove_unmatched_endings(sql_content)
-        assert "if condition" in result.refactored_content
-        assert "{% endif %}" in result.refactored_content
-        assert len(result.deprecation_refactors) == 0
-
-    def test_matched_if_with_parenthesis(self):
-        sql_content = """
         {% if(condition) %}
         select *
         from my_table
         {% endif %}
+        """,
+        None,
+        [],
+        id="matched_if_with_parenthesis",
+    ),
+    pytest.param(
         """
-        result = remove_unmatched_endings(sql_content)
-        assert "if(condition)" in result.refactored_content
-        assert "{% endif %}" in result.refactored_content
-        assert len(result.deprecation_refactors) == 0
-
-    def test_matched_if_with_macro_in_name(self):
-        sql_content = """
         {% if(macro_test) %}
         select *
         from my_table
         {% endif %}
+        """,
+        None,
+        [],
+        id="matched_if_with_macro_in_name",
+    ),
+    pytest.param("", None, [], id="empty"),
+    pytest.param(
+        """
+        select *
+        from my_table
+        where x = 1
+        """,
+        None,
+        [],
+        id="no_tags",
+    ),
+    pytest.param(
         """
+        select *
+        from my_table
+        {% 
+        endmacro
+         %}
+        where x = 1
+        """,
+        "endmacro",
+        ["Removed unmatched {% endmacro %}"],
+        id="multiline_tag",
+    ),
+    pytest.param(
+        """-- This is a comment
+        -- {% endif %}
+        select * from table""",
+        "{% endif %}",
+        ["Removed unmatched {% endif %}"],
+        id="endif_in_sql_comment",
+    ),
+    pytest.param(
+        """-- This is a comment
+        select * from table
+        -- {% endmacro %}""",
+        "{% endmacro %}",
+        ["Removed unmatched {% endmacro %}"],
+        id="endmacro_in_sql_comment",
+    ),
+    pytest.param(
+        """{% for item in items %}
+        select {{ item }} from table
+        {% endfor %}
+        {% endif %}""",
+        "{% endif %}",
+        ["Removed unmatched {% endif %}"],
+        id="after_for_loop",
+    ),
+    pytest.param(
+        """{% set x = 5 %}
+        select {{ x }} as value
+        {% endmacro %}""",
+        "{% endmacro %}",
+        ["Removed unmatched {% endmacro %}"],
+        id="after_set_statement",
+    ),
+]
+
+UNMATCHED_ENDINGS_LINE_NUMBER_CASES = [
+    pytest.param(
+        "{% macro test() %}select 1{% endmacro %}{% endif %}",
+        ["Removed unmatched {% endif %} near line 1"],
+        id="single_line",
+    ),
+    pytest.param(
+        "{% macro test() %}\nselect 1\n{% endmacro %}\n{% endif %}",
+        ["Removed unmatched {% endif %} near line 4"],
+        id="no_leading_newline",
+    ),
+    pytest.param(
+        "\n{% macro test() %}\nselect 1\n{% endmacro %}\n{% endif %}",
+        ["Removed unmatched {% endif %} near line 5"],
+        id="leading_newline",
+    ),
+    pytest.param(
+        "{% macro test() %}\r\nselect 1\n{% endmacro %}\r\n{% endif %}",
+        ["Removed unmatched {% endif %} near line 4"],
+        id="mixed_newlines",
+    ),
+    pytest.param(
+        """select 1
+        {% endif %}
+        select 2
+        {% endif %}
+        select 3""",
+        ["Removed unmatched {% endif %} near line 2", "Removed unmatched {% endif %} near line 4"],
+        id="multiple_unmatched",
+    ),
+]
+
+
+class TestUnmatchedEndingsRemoval:
+    """Tests for remove_unmatched_endings function"""
+
+    @pytest.mark.parametrize("sql_content, removed_tag, expected_logs", UNMATCHED_ENDINGS_CASES)
+    def test_unmatched_endings(self, sql_content: str, removed_tag: Optional[str], expected_logs: List[str]):
         result = remove_unmatched_endings(sql_content)
-        assert "if(macro_test)" in result.refactored_content
-        assert "{% endif %}" in result.refactored_content
-        assert len(result.deprecation_refactors) == 0
+        if removed_tag is None:
+            assert result.refactored_content == sql_content
+        else:
+            assert removed_tag not in result.refactored_content
+        assert len(result.deprecation_refactors) == len(expected_logs)
+        for refactor, expected_log in zip(result.deprecation_refactors, expected_logs):
+            assert expected_log in refactor.log
 
     def test_nested_structures(self):
         sql_content = """
@@ -315,96 +398,30 @@ class TestUnmatchedEndingsRemoval:
         assert any("Removed unmatched {% endif %}" in refactor.log for refactor in result.deprecation_refactors)
         assert any("Removed unmatched {% endmacro %}" in refactor.log for refactor in result.deprecation_refactors)
 
-    def test_empty_and_no_tags(self):
-        # Empty content
-        result = remove_unmatched_endings("")
-        assert result.refactored_content == ""
-        assert len(result.deprecation_refactors) == 0
-
-        # No Jinja tags
-        sql_content = """
-        select *
-        from my_table
-        where x = 1
-        """
-        result = remove_unmatched_endings(sql_content)
-        assert result.refactored_content.strip() == sql_content.strip()
-        assert len(result.deprecation_refactors) == 0
-
-    def test_multiline_tags(self):
-        sql_content = """
-        select *
-        from my_table
-        {% 
-        endmacro
-         %}
-        where x = 1
-        """
-        result = remove_unmatched_endings(sql_content)
-        assert "endmacro" not in result.refactored_content
-        assert len(result.deprecation_refactors) == 1
-        assert "Removed unmatched {% endmacro %}" in result.deprecation_refactors[0].log
-
-    def test_whitespace_control(self):
-        test_cases = [
-            "{%- endmacro %}",  # Leading
-            "{% endmacro -%}",  # Trailing
-            "{%- endmacro -%}",  # Both
-            """{%-
+    @pytest.mark.parametrize(
+        "sql_content",
+        [
+            pytest.param("{%- endmacro %}", id="leading"),
+            pytest.param("{% endmacro -%}", id="trailing"),
+            pytest.param("{%- endmacro -%}", id="both"),
+            pytest.param(
+                """{%-
                 endmacro
-            -%}""",  # Multi-line
-            """{%- if condition %}
+            -%}""",
+                id="multi_line",
+            ),
+            pytest.param(
+                """{%- if condition %}
             select 1
             {%- endif -%}
-            {% endmacro %}""",  # Mixed
-        ]
-
-        for content in test_cases:
-            result = remove_unmatched_endings(content)
-            assert "endmacro" not in result.refactored_content or (
-                "{% if condition %}" in content and "{% endmacro %}" not in result.refactored_content
-            )
-            if "endmacro" in content and "if condition" not in content:
-                assert len(result.deprecation_refactors) == 1
-                assert "Removed unmatched {% endmacro %}" in result.deprecation_refactors[0].log
-
-    def test_line_numbers(self):
-        # Single line
-        sql_content = "{% macro test() %}select 1{% endmacro %}{% endif %}"
-        logs = [refactor.log for refactor in remove_unmatched_endings(sql_content).deprecation_refactors]
-        assert logs[0] == "Removed unmatched {% endif %} near line 1"
-
-        # No leading newline
-        sql_content = "{% macro test() %}\nselect 1\n{% endmacro %}\n{% endif %}"
-        logs = [refactor.log for refactor in remove_unmatched_endings(sql_content).deprecation_refactors]
-        assert logs[0] == "Removed unmatched {% endif %} near line 4"
-
-        # With leading newline
-        sql_content = "\n{% macro test() %}\nselect 1\n{% endmacro %}\n{% endif %}"
-        logs = [refactor.log for refactor in remove_unmatched_endings(sql_content).deprecation_refactors]
-        assert logs[0] == "Removed unmatched {% endif %} near line 5"
-
-        # Mixed newlines
-        sql_content = "{% macro test() %}\r\nselect 1\n{% endmacro %}\r\n{% endif %}"
-        logs = [refactor.log for refactor in remove_unmatched_endings(sql_content).deprecation_refactors]
-        assert logs[0] == "Removed unmatched {% endif %} near line 4"
-
-    def test_in_comments(self):
-        # Endif in comments
-        sql_content = """-- This is a comment
-        -- {% endif %}
-        select * from table"""
-        result = remove_unmatched_endings(sql_content)
-        assert "{% endif %}" not in result.refactored_content
-        assert len(result.deprecation_refactors) == 1
-        assert "Removed unmatched {% endif %}" in result.deprecation_refactors[0].log
-
-        # Endmacro in comments
-        sql_content = """-- This is a comment
-        select * from table
-        -- {% endmacro %}"""
+            {% endmacro %}""",
+                id="mixed",
+            ),
+        ],
+    )
+    def test_whitespace_control(self, sql_content: str):
         result = remove_unmatched_endings(sql_content)
-        assert "{% endmacro %}" not in result.refactored_content
+        assert "endmacro" not in result.refactored_content
         assert len(result.deprecation_refactors) == 1
         assert "Removed unmatched {% endmacro %}" in result.deprecation_refactors[0].log
 
@@ -446,53 +463,23 @@ class TestUnmatchedEndingsRemoval:
         assert "{% endif %}" in result.refactored_content
         assert len(result.deprecation_refactors) == 0
 
-    def test_after_other_tags(self):
-        # After for loop
-        sql_content = """{% for item in items %}
-        select {{ item }} from table
-        {% endfor %}
-        {% endif %}"""
+    @pytest.mark.parametrize("sql_content, expected_logs", UNMATCHED_ENDINGS_LINE_NUMBER_CASES)
+    def test_line_numbers(self, sql_content: str, expected_logs: List[str]):
         result = remove_unmatched_endings(sql_content)
-        assert "{% endif %}" not in result.refactored_content
-        assert len(result.deprecation_refactors) == 1
-        assert "Removed unmatched {% endif %}" in result.deprecation_refactors[0].log
-
-        # After set statement
-        sql_content = """{% set x = 5 %}
-        select {{ x }} as value
-        {% endmacro %}"""
-        result = remove_unmatched_endings(sql_content)
-        assert "{% endmacro %}" not in result.refactored_content
-        assert len(result.deprecation_refactors) == 1
-        assert "Removed unmatched {% endmacro %}" in result.deprecation_refactors[0].log
-
-    def test_multiple_unmatched(self):
-        sql_content = """select 1
-        {% endif %}
-        select 2
-        {% endif %}
-        select 3"""
-        refactor_result = remove_unmatched_endings(sql_content)
-
-        assert "{% endif %}" not in refactor_result.refactored_content
-        assert len(refactor_result.deprecation_refactors) == 2
-        assert refactor_result.deprecation_refactors[0].log == "Removed unmatched {% endif %} near line 2"
-        assert refactor_result.deprecation_refactors[1].log == "Removed unmatched {% endif %} near line 4"
+        assert [refactor.log for refactor in result.deprecation_refactors] == expected_logs
 
 
 class TestYamlRefactoring:
     """Tests for YAML refactoring functions"""
 
-    def test_changeset_refactor_yml_with_config_fields(
-        self, temp_project_dir: Path, schema_yml_with_config_fields: str, schema_specs: SchemaSpecs
-    ):
+    def test_changeset_refactor_yml_with_config_fields(self, temp_project_dir: Path, schema_specs: SchemaSpecs):
         # Create a test YAML file
         yml_file = temp_project_dir / "models" / "schema.yml"
         yml_file.parent.mkdir(parents=True, exist_ok=True)
-        yml_file.write_text(schema_yml_with_config_fields)
+        yml_file.write_text(SCHEMA_YML_WITH_CONFIG_FIELDS)
 
         # Test the refactoring
-        result = changeset_refactor_yml_str(schema_yml_with_config_fields, schema_specs)
+        result = changeset_refactor_yml_str(SCHEMA_YML_WITH_CONFIG_FIELDS, schema_specs)
         assert result.refactored
         # Now expect 4 logs: 3 fields moved + meta merge
         assert len(result.refactor_logs) == 4
@@ -515,9 +502,7 @@ class TestYamlRefactoring:
         # Check that meta was merged correctly
         assert model["config"]["meta"]["abc"] == 123
 
-    def test_changeset_all_yml_files(
-        self, temp_project_dir: Path, schema_yml_with_config_fields: str, schema_specs: SchemaSpecs
-    ):
+    def test_changeset_all_yml_files(self, temp_project_dir: Path, schema_specs: SchemaSpecs):
         # Create multiple YAML files
         models_dir = temp_project_dir / "models"
         models_dir.mkdir(parents=True, exist_ok=True)
@@ -528,8 +513,8 @@ class TestYamlRefactoring:
         sub_dir.joinpath("model.sql").write_text("not a YAML file")
 
         # Write YAML files
-        models_dir.joinpath("schema.yml").write_text(schema_yml_with_config_fields)
-        sub_dir.joinpath("other_schema.yaml").write_text(schema_yml_with_config_fields)
+        models_dir.joinpath("schema.yml").write_text(SCHEMA_YML_WITH_CONFIG_FIELDS)
+        sub_dir.joinpath("other_schema.yaml").write_text(SCHEMA_YML_WITH_CONFIG_FIELDS)
 
         # Get all refactored results
         results = changeset_all_sql_yml_files(temp_project_dir, schema_specs)
@@ -543,20 +528,22 @@ class TestYamlRefactoring:
         assert all(r.refactored for r in yaml_results if r.file_path.name != "dbt_project.yml")
 
         # Check that both files were processed
-        processed_files = {r.file_path for r in yaml_results}
-        assert (models_dir / "schema.yml").resolve() in processed_files
-        assert (sub_dir / "other_schema.yaml").resolve() in processed_files
+        expected_top = (models_dir / "schema.yml").resolve()
+        expected_sub = (sub_dir / "other_schema.yaml").resolve()
+        expected_files = sorted([str(expected_top), str(expected_sub)])
+        processed_files = sorted(str(r.file_path) for r in yaml_results if r.file_path.name != "dbt_project.yml")
+        assert processed_files == expected_files
 
     def test_changeset_refactor_yml_with_fields_top_and_under_config(
-        self, temp_project_dir: Path, schema_yml_with_fields_top_and_under_config: str, schema_specs: SchemaSpecs
+        self, temp_project_dir: Path, schema_specs: SchemaSpecs
     ):
         # Create a test YAML file
         yml_file = temp_project_dir / "models" / "schema.yml"
         yml_file.parent.mkdir(parents=True, exist_ok=True)
-        yml_file.write_text(schema_yml_with_fields_top_and_under_config)
+        yml_file.write_text(SCHEMA_YML_WITH_FIELDS_TOP_AND_UNDER_CONFIG)
 
         # Test the refactoring
-        result = changeset_refactor_yml_str(schema_yml_with_fields_top_and_under_config, schema_specs)
+        result = changeset_refactor_yml_str(SCHEMA_YML_WITH_FIELDS_TOP_AND_UNDER_CONFIG, schema_specs)
         assert result.refactored
         assert isinstance(result, YMLRuleRefactorResult)
         # Now expect 4 logs: 1 already under config, 2 moved, 1 meta merge
@@ -577,16 +564,14 @@ class TestYamlRefactoring:
         assert model["config"]["database"] == "my_db"
         assert model["config"]["schema"] == "my_schema"
 
-    def test_changeset_refactor_yml_with_close_matches(
-        self, temp_project_dir: Path, schema_yml_with_close_matches: str, schema_specs: SchemaSpecs
-    ):
+    def test_changeset_refactor_yml_with_close_matches(self, temp_project_dir: Path, schema_specs: SchemaSpecs):
         # Create a test YAML file
         yml_file = temp_project_dir / "models" / "schema.yml"
         yml_file.parent.mkdir(parents=True, exist_ok=True)
-        yml_file.write_text(schema_yml_with_close_matches)
+        yml_file.write_text(SCHEMA_YML_WITH_CLOSE_MATCHES)
 
         # Test the refactoring
-        result = changeset_refactor_yml_str(schema_yml_with_close_matches, schema_specs)
+        result = changeset_refactor_yml_str(SCHEMA_YML_WITH_CLOSE_MATCHES, schema_specs)
         assert result.refactored
         assert isinstance(result, YMLRuleRefactorResult)
         # Now expect 2 logs: 2 close matches
@@ -610,16 +595,14 @@ class TestYamlRefactoring:
         assert any("'materialize' is not allowed, but 'materialized' is" in log for log in result.refactor_logs)
         assert any("'full-refresh' is not allowed, but 'full_refresh' is" in log for log in result.refactor_logs)
 
-    def test_changeset_refactor_yml_with_nested_sources(
-        self, temp_project_dir: Path, schema_yml_with_nested_sources: str, schema_specs: SchemaSpecs
-    ):
+    def test_changeset_refactor_yml_with_nested_sources(self, temp_project_dir: Path, schema_specs: SchemaSpecs):
         # Create a test YAML file
         yml_file = temp_project_dir / "models" / "sources.yml"
         yml_file.parent.mkdir(parents=True, exist_ok=True)
-        yml_file.write_text(schema_yml_with_nested_sources)
+        yml_file.write_text(SCHEMA_YML_WITH_NESTED_SOURCES)
 
         # Test the refactoring
-        result = changeset_refactor_yml_str(schema_yml_with_nested_sources, schema_specs)
+        result = changeset_refactor_yml_str(SCHEMA_YML_WITH_NESTED_SOURCES, schema_specs)
         assert result.refactored
         assert isinstance(result, YMLRuleRefactorResult)
 
@@ -1044,16 +1027,14 @@ profile: garage-jaffle
 class TestOwnerPropertiesRefactoring:
     """Tests for owner properties refactoring"""
 
-    def test_owner_properties_refactoring(
-        self, temp_project_dir: Path, schema_yml_with_owner_properties: str, schema_specs: SchemaSpecs
-    ):
+    def test_owner_properties_refactoring(self, temp_project_dir: Path, schema_specs: SchemaSpecs):
         # Create a test YAML file
         yml_file = temp_project_dir / "models" / "schema.yml"
         yml_file.parent.mkdir(parents=True, exist_ok=True)
-        yml_file.write_text(schema_yml_with_owner_properties)
+        yml_file.write_text(SCHEMA_YML_WITH_OWNER_PROPERTIES)
 
         # Test the refactoring
-        result = changeset_owner_properties_yml_str(schema_yml_with_owner_properties, schema_specs)
+        result = changeset_owner_properties_yml_str(SCHEMA_YML_WITH_OWNER_PROPERTIES, schema_specs)
         assert result.refactored
         assert isinstance(result, YMLRuleRefactorResult)
         assert len(result.refactor_logs) == 4
@@ -0,0 +1,85 @@
+import os
+
+import httpx
+import pytest
+
+from dbt_autofix.retrieve_schemas import (
+    SCHEMA_SEPARATOR,
+    get_fusion_dbt_project_schema,
+    get_fusion_yml_schema,
+    get_schema_cache_dir,
+)
+
+SCHEMA_FILE_NAME = "fs-schema-dbt-project-1.0.0.json"
+
+
+@pytest.fixture
+def schema_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.delenv("DBT_AUTOFIX_NO_CACHE", raising=False)
+    return get_schema_cache_dir()
+
+
+def serve_schema(monkeypatch, schema_text: str) -> list[str]:
+    """Answer schema downloads with schema_text, returning the list of requested URLs."""
+    requested_urls = []
+
+    def fake_get(url, **kwargs):
+        requested_urls.append(url)
+        return httpx.Response(200, text=schema_text, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(httpx, "get", fake_get)
+    return requested_urls
+
+
+def test_schema_is_cached_after_download(schema_cache_dir, monkeypatch):
+    requested_urls = serve_schema(monkeypatch, '{"definitions": {}}')
+
+    assert get_fusion_dbt_project_schema("1.0.0") == {"definitions": {}}
+    assert get_fusion_dbt_project_schema("1.0.0") == {"definitions": {}}
+
+    assert len(requested_urls) == 1
+    assert (schema_cache_dir / SCHEMA_FILE_NAME).read_text() == '{"definitions": {}}'
+
+
+def test_no_cache_env_var_downloads_again(schema_cache_dir, monkeypatch):
+    schema_cache_dir.mkdir(parents=True)
+    (schema_cache_dir / SCHEMA_FILE_NAME).write_text('{"stale": true}')
+    requested_urls = serve_schema(monkeypatch, '{"fresh": true}')
+    monkeypatch.setenv("DBT_AUTOFIX_NO_CACHE", "1")
+
+    assert get_fusion_dbt_project_schema("1.0.0") == {"fresh": True}
+    assert len(requested_urls) == 1
+    # the refreshed schema replaces the cached one
+    assert (schema_cache_dir / SCHEMA_FILE_NAME).read_text() == '{"fresh": true}'
+
+
+def test_corrupt_cache_is_downloaded_again(schema_cache_dir, monkeypatch):
+    schema_cache_dir.mkdir(parents=True)
+    # a run interrupted before the rename was introduced could leave a truncated file
+    (schema_cache_dir / SCHEMA_FILE_NAME).write_text('{"definitions": {')
+    requested_urls = serve_schema(monkeypatch, '{"definitions": {}}')
+
+    assert get_fusion_dbt_project_schema("1.0.0") == {"definitions": {}}
+    assert len(requested_urls) == 1
+    assert (schema_cache_dir / SCHEMA_FILE_NAME).read_text() == '{"definitions": {}}'
+
+
+def test_cache_write_failure_leaves_no_temp_file(schema_cache_dir, monkeypatch):
+    serve_schema(monkeypatch, '{"definitions": {}}')
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+
+    assert get_fusion_dbt_project_schema("1.0.0") == {"definitions": {}}
+    assert list(schema_cache_dir.iterdir()) == []
+
+
+def test_cached_yml_schema_uses_the_schema_after_the_separator(schema_cache_dir, monkeypatch):
+    requested_urls = serve_schema(monkeypatch, f'{{"first": true}}\n{SCHEMA_SEPARATOR}\n{{"second": true}}')
+
+    assert get_fusion_yml_schema("1.0.0") == {"second": True}
+    assert get_fusion_yml_schema("1.0.0") == {"second": True}
+    assert len(requested_urls) == 1